@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import stat
 import tempfile
 import tomllib
 from dataclasses import dataclass, field
@@ -38,20 +39,28 @@ def ensure_table(
     return value
 
 
+def stat_config(cfg_path: Path) -> os.stat_result | None:
+    """Single stat for the exists/is-file checks; ``None`` when missing."""
+    try:
+        return cfg_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 def read_config(cfg_path: Path) -> dict:
-    if cfg_path.exists() and not cfg_path.is_file():
+    st = stat_config(cfg_path)
+    if st is not None and not stat.S_ISREG(st.st_mode):
         logger.error("config.read.not_file", path=str(cfg_path))
         raise ConfigError(f"Config path {cfg_path} exists but is not a file.") from None
     try:
-        raw = cfg_path.read_text(encoding="utf-8")
+        with open(os.fspath(cfg_path), "rb") as fh:
+            return tomllib.load(fh)
     except FileNotFoundError:
         logger.warning("config.read.missing", path=str(cfg_path))
         raise ConfigError(f"Missing config file {cfg_path}.") from None
     except OSError as e:
         logger.error("config.read.os_error", path=str(cfg_path), error=str(e))
         raise ConfigError(f"Failed to read config file {cfg_path}: {e}") from e
-    try:
-        return tomllib.loads(raw)
     except tomllib.TOMLDecodeError as e:
         logger.error("config.read.toml_error", path=str(cfg_path), error=str(e))
         raise ConfigError(f"Malformed TOML in {cfg_path}: {e}") from None
@@ -63,10 +72,11 @@ def load_or_init_config(path: str | Path | None = None) -> tuple[dict, Path]:
         if env_path:
             path = env_path
     cfg_path = Path(path).expanduser() if path else HOME_CONFIG_PATH
-    if cfg_path.exists() and not cfg_path.is_file():
-        raise ConfigError(f"Config path {cfg_path} exists but is not a file.") from None
-    if not cfg_path.exists():
+    st = stat_config(cfg_path)
+    if st is None:
         return {}, cfg_path
+    if not stat.S_ISREG(st.st_mode):
+        raise ConfigError(f"Config path {cfg_path} exists but is not a file.") from None
     return read_config(cfg_path), cfg_path
 
 
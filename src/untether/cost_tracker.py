@@ -10,12 +10,19 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
-# Daily cost accumulator: (date_str, total_cost).
+
+@dataclass(slots=True)
+class _DailyCost:
+    date: str = ""
+    total: float = 0.0
+
+
+# Daily cost accumulator, updated in place.
 # #379: guarded by `_daily_cost_lock` so concurrent finalize_run calls can't
 # race the read-modify-write and silently lose a run's cost. The critical
-# section is a single tuple assignment (sub-microsecond), so a `threading.Lock`
+# section is two attribute stores (sub-microsecond), so a `threading.Lock`
 # is fine — both async tasks (cooperative) and threaded callers are safe.
-_daily_cost: tuple[str, float] = ("", 0.0)
+_daily_cost = _DailyCost()
 _daily_cost_lock = threading.Lock()
 
 
@@ -36,18 +43,36 @@ class CostAlert:
     scope: str = ""  # "per_run" or "per_day"
 
 
+# (next local midnight as a wall-clock timestamp, today's date string).
+# Swapped as one tuple so threaded readers never see a torn pair.
+_today_cache: tuple[float, str] = (0.0, "")
+
+
 def _today() -> str:
-    return time.strftime("%Y-%m-%d")
+    global _today_cache
+    now = time.time()
+    until, today = _today_cache
+    if now < until:
+        return today
+    lt = time.localtime(now)
+    today = time.strftime("%Y-%m-%d", lt)
+    # mktime normalises day overflow and resolves DST, so this is the real
+    # local midnight even on 23h/25h days.
+    until = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    _today_cache = (until, today)
+    return today
 
 
 def record_run_cost(cost: float) -> None:
     """Record the cost of a completed run for daily tracking."""
-    global _daily_cost
     today = _today()
     with _daily_cost_lock:
-        date, total = _daily_cost
-        _daily_cost = (today, cost) if date != today else (today, total + cost)
-        daily_total = _daily_cost[1]
+        if _daily_cost.date != today:
+            _daily_cost.date = today
+            _daily_cost.total = cost
+        else:
+            _daily_cost.total += cost
+        daily_total = _daily_cost.total
     logger.debug(
         "cost_tracker.recorded",
         cost=cost,
@@ -58,7 +83,8 @@ def record_run_cost(cost: float) -> None:
 def get_daily_cost() -> float:
     """Get today's accumulated cost."""
     with _daily_cost_lock:
-        date, total = _daily_cost
+        date = _daily_cost.date
+        total = _daily_cost.total
     if date != _today():
         return 0.0
     return total
@@ -72,84 +98,85 @@ def check_run_budget(
 
     Returns a CostAlert if a threshold is crossed, or None.
     """
+    per_run = budget.max_cost_per_run
+    per_day = budget.max_cost_per_day
     logger.debug(
         "cost_budget.check",
         run_cost=run_cost,
-        has_per_run=budget.max_cost_per_run is not None,
-        has_per_day=budget.max_cost_per_day is not None,
+        has_per_run=per_run is not None,
+        has_per_day=per_day is not None,
     )
-    if budget.max_cost_per_run is not None and run_cost > 0:
-        if run_cost >= budget.max_cost_per_run:
+    if per_run is None and per_day is None:
+        return None
+    if per_run is not None and run_cost > 0:
+        ratio = run_cost / per_run * 100
+        if run_cost >= per_run:
             logger.error(
                 "cost_budget.exceeded",
                 scope="per_run",
                 run_cost=run_cost,
-                budget=budget.max_cost_per_run,
+                budget=per_run,
                 auto_cancel=budget.auto_cancel,
             )
             return CostAlert(
                 level="exceeded",
                 message=(
                     f"🛑 Run cost ${run_cost:.2f} exceeded "
-                    f"per-run budget ${budget.max_cost_per_run:.2f}"
+                    f"per-run budget ${per_run:.2f}"
                 ),
                 should_cancel=budget.auto_cancel,
-                ratio=run_cost / budget.max_cost_per_run * 100,
+                ratio=ratio,
                 scope="per_run",
             )
-        ratio = run_cost / budget.max_cost_per_run * 100
         if ratio >= budget.warn_at_pct:
             logger.warning(
                 "cost_budget.alert",
                 scope="per_run",
                 run_cost=run_cost,
-                budget=budget.max_cost_per_run,
+                budget=per_run,
                 ratio=round(ratio, 1),
             )
             return CostAlert(
                 level="warning",
                 message=(
                     f"⚠️ Run cost ${run_cost:.2f} is {ratio:.0f}% of "
-                    f"per-run budget ${budget.max_cost_per_run:.2f}"
+                    f"per-run budget ${per_run:.2f}"
                 ),
                 ratio=ratio,
                 scope="per_run",
             )
 
-    if budget.max_cost_per_day is not None:
+    if per_day is not None:
         daily = get_daily_cost()
-        if daily >= budget.max_cost_per_day:
+        ratio = daily / per_day * 100
+        if daily >= per_day:
             logger.error(
                 "cost_budget.exceeded",
                 scope="per_day",
                 daily_cost=daily,
-                budget=budget.max_cost_per_day,
+                budget=per_day,
                 auto_cancel=budget.auto_cancel,
             )
             return CostAlert(
                 level="exceeded",
-                message=(
-                    f"🛑 Daily cost ${daily:.2f} exceeded "
-                    f"budget ${budget.max_cost_per_day:.2f}"
-                ),
+                message=f"🛑 Daily cost ${daily:.2f} exceeded budget ${per_day:.2f}",
                 should_cancel=budget.auto_cancel,
-                ratio=daily / budget.max_cost_per_day * 100,
+                ratio=ratio,
                 scope="per_day",
             )
-        ratio = daily / budget.max_cost_per_day * 100
         if ratio >= budget.warn_at_pct:
             logger.warning(
                 "cost_budget.alert",
                 scope="per_day",
                 daily_cost=daily,
-                budget=budget.max_cost_per_day,
+                budget=per_day,
                 ratio=round(ratio, 1),
             )
             return CostAlert(
                 level="warning",
                 message=(
                     f"⚠️ Daily cost ${daily:.2f} is {ratio:.0f}% of "
-                    f"budget ${budget.max_cost_per_day:.2f}"
+                    f"budget ${per_day:.2f}"
                 ),
                 ratio=ratio,
                 scope="per_day",
@@ -57,7 +57,16 @@ def pipeline_log_level() -> str:
     return _PIPELINE_LEVEL_NAME
 
 
+def pipeline_log_enabled() -> bool:
+    """Whether ``log_pipeline`` events would pass the configured log level."""
+    return _LEVELS[_PIPELINE_LEVEL_NAME] >= _MIN_LEVEL
+
+
 def log_pipeline(logger: Any, event: str, **fields: Any) -> None:
+    # Pipeline events fire per JSONL line; skip the processor chain outright
+    # when _drop_below_level would discard them anyway.
+    if not pipeline_log_enabled():
+        return
     if _PIPELINE_LEVEL_NAME == "info":
         logger.info(event, **fields)
     else:
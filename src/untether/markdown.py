@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 import re
-import textwrap
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
@@ -28,9 +27,21 @@ class MarkdownParts:
 
 
 def assemble_markdown_parts(parts: MarkdownParts) -> str:
-    return "\n\n".join(
-        chunk for chunk in (parts.header, parts.body, parts.footer) if chunk
-    )
+    # Runs on every progress render; branch on the handful of shapes rather
+    # than filtering a generator into str.join.
+    header = parts.header
+    body = parts.body
+    footer = parts.footer
+    if body and footer:
+        if header:
+            return f"{header}\n\n{body}\n\n{footer}"
+        return f"{body}\n\n{footer}"
+    tail = body or footer
+    if not tail:
+        return header
+    if not header:
+        return tail
+    return f"{header}\n\n{tail}"
 
 
 def format_changed_file_path(path: str, *, base_dir: Path | None = None) -> str:
@@ -66,7 +77,16 @@ def shorten(text: str, width: int | None) -> str:
         return ""
     if len(text) <= width:
         return text
-    return textwrap.shorten(text, width=width, placeholder="…")
+    # Collapse whitespace, then cut at the last word boundary that leaves
+    # room for the ellipsis. A leading word longer than half the width is
+    # hard-cut instead of collapsing the whole title to a bare "…".
+    text = " ".join(text.split())
+    if len(text) <= width:
+        return text
+    cut = text.rfind(" ", 0, width)
+    if cut <= width // 2:
+        cut = width - 1
+    return text[:cut].rstrip() + "…"
 
 
 def action_status(action: Action, *, completed: bool, ok: bool | None = None) -> str:
@@ -359,6 +379,13 @@ def format_verbose_detail(action: Action) -> str | None:
     return None
 
 
+def _verbose_detail_line(action: Action) -> str | None:
+    detail_line = format_verbose_detail(action)
+    if not detail_line:
+        return None
+    return f"  {shorten(detail_line, _VERBOSE_DETAIL_WIDTH)}"
+
+
 def render_event_cli(event: UntetherEvent) -> list[str]:
     match event:
         case StartedEvent(engine=engine):
@@ -386,6 +413,12 @@ _CLAUDE_MODEL_RE = re.compile(
 
 _CONTEXT_SUFFIX_MAP: dict[str, str] = {"1m": "1M"}
 
+_MODEL_FAMILY_RE = re.compile(r"opus|sonnet|haiku", re.IGNORECASE)
+
+# Model IDs come from a tiny closed set, but the footer re-renders them on
+# every progress edit.
+_SHORT_MODEL_NAMES: dict[str, str] = {}
+
 
 def _short_model_name(model: str) -> str:
     """Shorten a Claude model ID to its family name with version.
@@ -394,6 +427,16 @@ def _short_model_name(model: str) -> str:
     ``'claude-opus-4-6[1m]'`` → ``'opus 4.6 (1M)'``
     ``'claude-sonnet-4-5-20250929'`` → ``'sonnet 4.5'``
     """
+    short = _SHORT_MODEL_NAMES.get(model)
+    if short is None:
+        short = _compute_short_model_name(model)
+        if len(_SHORT_MODEL_NAMES) >= 64:
+            _SHORT_MODEL_NAMES.clear()
+        _SHORT_MODEL_NAMES[model] = short
+    return short
+
+
+def _compute_short_model_name(model: str) -> str:
     m = _CLAUDE_MODEL_RE.search(model)
     if m:
         base = f"{m.group(1).lower()} {m.group(2)}.{m.group(3)}"
@@ -402,12 +445,12 @@ def _short_model_name(model: str) -> str:
             label = _CONTEXT_SUFFIX_MAP.get(suffix.lower(), suffix.upper())
             return f"{base} ({label})"
         return base
-    for family in ("opus", "sonnet", "haiku"):
-        if family in model.lower():
-            return family
-    if model.lower().startswith("auto-"):
+    m = _MODEL_FAMILY_RE.search(model)
+    if m:
+        return m.group(0).lower()
+    if model[:5].lower() == "auto-":
         model = model[5:]
-    return model.split("-202")[0] if "-202" in model else model
+    return model.split("-202", 1)[0]
 
 
 def format_meta_line(meta: dict[str, Any]) -> str | None:
@@ -446,6 +489,12 @@ class MarkdownFormatter:
         self.max_actions = max(0, int(max_actions))
         self.command_width = command_width
         self.verbosity = verbosity
+        # Rendered lines for completed actions, keyed by id(action). The
+        # action is stored alongside so a recycled id never hits. Running
+        # actions are never cached: the heartbeat mutates their detail
+        # (countdown_s) and their elapsed tail changes every tick.
+        self._line_cache: dict[int, tuple[Action, bool | None, str]] = {}
+        self._detail_cache: dict[int, tuple[Action, str | None]] = {}
 
     def refresh_from(self, progress: Any) -> None:
         """Update mutable formatting knobs from a ``ProgressSettings`` snapshot (#269).
@@ -529,6 +578,14 @@ class MarkdownFormatter:
         actions = [] if self.max_actions == 0 else actions[-self.max_actions :]
         lines: list[str] = []
         for action_state in actions:
+            action = action_state.action
+            if action_state.display_phase == "completed":
+                lines.append(self._completed_line(action, action_state.ok))
+                if self.verbosity == "verbose":
+                    detail_line = self._completed_detail(action)
+                    if detail_line:
+                        lines.append(detail_line)
+                continue
             # #481: derive per-action elapsed when both ``now`` and
             # ``started_at`` are available. Tests that don't pass a clock
             # default to None → no tail (preserves the existing compact
@@ -536,20 +593,43 @@ class MarkdownFormatter:
             elapsed_seconds: float | None = None
             if now is not None and action_state.started_at > 0:
                 elapsed_seconds = max(0.0, now - action_state.started_at)
-            line = format_action_line(
-                action_state.action,
-                action_state.display_phase,
-                action_state.ok,
-                command_width=self.command_width,
-                elapsed_seconds=elapsed_seconds,
+            lines.append(
+                format_action_line(
+                    action,
+                    action_state.display_phase,
+                    action_state.ok,
+                    command_width=self.command_width,
+                    elapsed_seconds=elapsed_seconds,
+                )
             )
-            lines.append(line)
             if self.verbosity == "verbose":
-                detail_line = format_verbose_detail(action_state.action)
+                detail_line = _verbose_detail_line(action)
                 if detail_line:
-                    lines.append(f"  {shorten(detail_line, _VERBOSE_DETAIL_WIDTH)}")
+                    lines.append(detail_line)
         return lines
 
+    def _completed_line(self, action: Action, ok: bool | None) -> str:
+        cached = self._line_cache.get(id(action))
+        if cached is not None and cached[0] is action and cached[1] == ok:
+            return cached[2]
+        line = format_action_line(
+            action, "completed", ok, command_width=self.command_width
+        )
+        if len(self._line_cache) > 4 * max(self.max_actions, 1):
+            self._line_cache.clear()
+        self._line_cache[id(action)] = (action, ok, line)
+        return line
+
+    def _completed_detail(self, action: Action) -> str | None:
+        cached = self._detail_cache.get(id(action))
+        if cached is not None and cached[0] is action:
+            return cached[1]
+        detail_line = _verbose_detail_line(action)
+        if len(self._detail_cache) > 4 * max(self.max_actions, 1):
+            self._detail_cache.clear()
+        self._detail_cache[id(action)] = (action, detail_line)
+        return detail_line
+
     @staticmethod
     def _assemble_body(lines: list[str]) -> str | None:
         if not lines:
@@ -46,6 +46,13 @@ class PluginNotFound(LookupError):
 
 _LOAD_ERRORS: dict[tuple[str, str, str, str | None, str], PluginLoadError] = {}
 _LOADED: dict[tuple[str, str], Any] = {}
+# Successful loads keyed by (group, name, normalised allowlist), checked
+# before entry-point discovery: re-reading installed distribution metadata
+# is the expensive part of every lookup, and per-message command dispatch
+# repeats it. Keying on the allowlist means a config reload that changes it
+# is honoured immediately; misses are never cached, so a newly installed
+# plugin is still discovered.
+_RESOLVED: dict[tuple[str, str, frozenset[str] | None], Any] = {}
 
 
 def _error_key(error: PluginLoadError) -> tuple[str, str, str, str | None, str]:
@@ -86,6 +93,7 @@ def clear_load_errors(*, group: str | None = None, name: str | None = None) -> N
 def reset_plugin_state() -> None:
     clear_load_errors()
     _LOADED.clear()
+    _RESOLVED.clear()
 
 
 def _select_entrypoints(group: str) -> list[EntryPoint]:
@@ -239,6 +247,11 @@ def load_entrypoint(
     allowlist: Iterable[str] | None = None,
     validator: Callable[[Any, EntryPoint], None] | None = None,
 ) -> Any:
+    allow = normalize_allowlist(allowlist)
+    resolved_key = (group, name, frozenset(allow) if allow is not None else None)
+    if resolved_key in _RESOLVED:
+        return _RESOLVED[resolved_key]
+
     by_name, duplicates = _discover_entrypoints(group, allowlist=allowlist)
     if name in duplicates:
         items = duplicates[name]
@@ -263,6 +276,7 @@ def load_entrypoint(
 
     key = (group, name)
     if key in _LOADED:
+        _RESOLVED[resolved_key] = _LOADED[key]
         return _LOADED[key]
 
     try:
@@ -283,6 +297,7 @@ def load_entrypoint(
         raise PluginLoadFailed(error) from exc
 
     _LOADED[key] = loaded
+    _RESOLVED[resolved_key] = loaded
     clear_load_errors(group=group, name=name)
     return loaded
 
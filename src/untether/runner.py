@@ -15,8 +15,9 @@ from typing import Any, Protocol, cast
 from weakref import WeakValueDictionary
 
 import anyio
+import msgspec
 
-from .logging import get_logger, log_pipeline
+from .logging import get_logger, log_pipeline, pipeline_log_enabled
 from .model import (
     Action,
     ActionEvent,
@@ -36,6 +37,13 @@ _lock_logger = get_logger(__name__)
 class ResumeTokenMixin:
     engine: EngineId
     resume_re: re.Pattern[str]
+    # Lowercase literal every resume line must contain; lets callers skip the
+    # regex for the common case of text without a resume command.
+    resume_prefilter: str | None = None
+
+    def _may_contain_resume(self, text: str) -> bool:
+        prefilter = self.resume_prefilter
+        return prefilter is None or prefilter in text.lower()
 
     def format_resume(self, token: ResumeToken) -> str:
         if token.engine != self.engine:
@@ -43,10 +51,12 @@ class ResumeTokenMixin:
         return f"`{self.engine} resume {token.value}`"
 
     def is_resume_line(self, line: str) -> bool:
+        if not self._may_contain_resume(line):
+            return False
         return bool(self.resume_re.match(line))
 
     def extract_resume(self, text: str | None) -> ResumeToken | None:
-        if not text:
+        if not text or not self._may_contain_resume(text):
             return None
         found: str | None = None
         for match in self.resume_re.finditer(text):
@@ -153,6 +163,27 @@ _OPENCODE_TOOL_STATUSES = frozenset({"completed", "error"})
 # the parser saw. recent_events still records them for diagnostics.
 _CONTROL_CHANNEL_EVENT_TYPES = frozenset({"control_request", "control_response"})
 
+
+class _JsonlPeek(msgspec.Struct):
+    """Top-level keys read by the engine-agnostic timeline peek.
+
+    Undeclared keys (stream deltas, final result text, duplicated tool
+    output) are skipped by the decoder without being materialised.
+    """
+
+    type: Any = "unknown"
+    tool_name: Any = None
+    tool: Any = None
+    name: Any = None
+    item: Any = None
+    message: Any = None
+    state: Any = None
+    properties: Any = None
+    part: Any = None
+
+
+_PEEK_DECODER = msgspec.json.Decoder(_JsonlPeek)
+
 # #526 rc20 follow-up: shared with runner_bridge.py for paced
 # ``subprocess.approval_pending`` INFO emission. The user-side stall
 # detector (bridge) and the watchdog-side liveness detector (here)
@@ -732,11 +763,13 @@ class JsonlSubprocessRunner(BaseRunner):
         logger: Any,
         pid: int,
     ) -> list[UntetherEvent]:
-        raw_text = raw_line.decode("utf-8", errors="replace")
-        line_text = line.decode("utf-8", errors="replace")
+        # The str forms are only needed for logging and the engine's
+        # error-event hooks, so decode them lazily on those paths.
         try:
             decoded = self.decode_jsonl(line=line)
         except Exception as exc:  # noqa: BLE001
+            raw_text = raw_line.decode("utf-8", errors="replace")
+            line_text = line.decode("utf-8", errors="replace")
             log_pipeline(
                 logger,
                 "jsonl.parse.error",
@@ -752,6 +785,8 @@ class JsonlSubprocessRunner(BaseRunner):
                 state=state,
             )
         if decoded is None:
+            raw_text = raw_line.decode("utf-8", errors="replace")
+            line_text = line.decode("utf-8", errors="replace")
             log_pipeline(
                 logger,
                 "jsonl.parse.invalid",
@@ -850,6 +885,8 @@ class JsonlSubprocessRunner(BaseRunner):
         jsonl_seq: int | None = None,
         source: str | None = None,
     ) -> None:
+        if not pipeline_log_enabled():
+            return
         payload: dict[str, Any] = {
             "pid": pid,
             "ok": event.ok,
@@ -913,20 +950,19 @@ class JsonlSubprocessRunner(BaseRunner):
             stream.background_observed = True
         # Peek at raw JSON for event timeline (engine-agnostic)
         try:
-            raw_dict = json.loads(line)
-        except (json.JSONDecodeError, ValueError):
-            raw_dict = None
-        if isinstance(raw_dict, dict):
-            etype = str(raw_dict.get("type", "unknown"))
+            peek = _PEEK_DECODER.decode(line)
+        except msgspec.DecodeError:
+            peek = None
+        if peek is not None:
+            etype = str(peek.type)
             etool = None
             # Cover common engine conventions for tool name
-            for key in ("tool_name", "tool", "name"):
-                val = raw_dict.get(key)
+            for val in (peek.tool_name, peek.tool, peek.name):
                 if isinstance(val, str) and val:
                     etool = val
                     break
             # Also check nested item.type for Codex-style events
-            item = raw_dict.get("item")
+            item = peek.item
             if etool is None and isinstance(item, dict):
                 itype = item.get("type")
                 if isinstance(itype, str) and itype:
@@ -943,7 +979,7 @@ class JsonlSubprocessRunner(BaseRunner):
             # intervening "other" events (attachments, system hooks) and is
             # cleared only by an assistant-turn-start event so the detector
             # sees a true "tool_result arrived, no follow-up" signal.
-            kind = _classify_jsonl_event(raw_dict)
+            kind = _classify_jsonl_event(msgspec.structs.asdict(peek))
             stream.last_event_kind = kind
             if kind == _TOOL_RESULT_EVENT_KIND:
                 stream.last_tool_result_at = now
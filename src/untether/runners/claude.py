@@ -8,16 +8,14 @@ to prevent deadlock when keeping stdin open for control responses.
 from __future__ import annotations
 
 import contextlib
-import json
+import functools
 import os
-import pty
 import re
 import shutil
 import signal
 import subprocess as subprocess_module
 import time
-import tty
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import UTC
@@ -33,7 +31,6 @@ from ..events import EventFactory
 from ..logging import get_logger
 from ..model import (
     Action,
-    ActionKind,
     CompletedEvent,
     EngineId,
     ResumeToken,
@@ -61,7 +58,7 @@ from ..utils.subprocess import (
     signal_pid_group,
     wrap_with_env_i,
 )
-from .run_options import get_run_options
+from .run_options import EngineRunOptions, get_run_options
 from .tool_actions import tool_input_path, tool_kind_and_title
 
 logger = get_logger(__name__)
@@ -69,10 +66,25 @@ logger = get_logger(__name__)
 ENGINE: EngineId = "claude"
 DEFAULT_ALLOWED_TOOLS = ["Bash", "Read", "Edit", "Write"]
 
+# Control-channel JSONL writes (control responses, the initialize
+# handshake, the prompt message) share one encoder; msgspec emits bytes
+# directly, so there is no str round-trip before the pipe write.
+_JSON_ENCODER = msgspec.json.Encoder()
+
 _RESUME_RE = re.compile(
     r"(?im)^\s*`?claude\s+(?:--resume|-r)\s+(?P<token>[^`\s]+)`?\s*$"
 )
 
+# Stream-json I/O prelude shared by every spawn; `-p` is prepended when the
+# prompt goes on argv instead of stdin.
+_STREAM_JSON_ARGS: tuple[str, ...] = (
+    "--output-format",
+    "stream-json",
+    "--input-format",
+    "stream-json",
+    "--verbose",
+)
+
 # Flags that Untether sets on every spawn (stream-json I/O, resume tokens,
 # permission wiring). A user-supplied copy in `[claude].extra_args` would
 # either duplicate the arg or collide with Untether's expected value, so
@@ -151,7 +163,7 @@ def _load_quarantine_on_forced_teardown() -> bool:
 
 
 # Phase 2: Global registry for active ClaudeRunner instances
-# Keyed by session_id, stores (runner_instance, timestamp)
+# Keyed by session_id, stores (runner_instance, time.monotonic() timestamp)
 _ACTIVE_RUNNERS: dict[str, tuple[ClaudeRunner, float]] = {}
 
 # Phase 2: Global registry mapping session_id -> process stdin
@@ -452,7 +464,7 @@ class ClaudeStreamState:
         str, tuple[claude_schema.StreamControlRequest, float]
     ] = field(default_factory=dict)
     # Auto-approve queue: request IDs that should be approved without user interaction
-    auto_approve_queue: list[str] = field(default_factory=list)
+    auto_approve_queue: deque[str] = field(default_factory=deque)
     # Auto-deny queue: (request_id, message) pairs for rate-limited denials
     auto_deny_queue: list[tuple[str, str]] = field(default_factory=list)
     # Whether the control channel initialization handshake has been sent
@@ -743,15 +755,14 @@ def _normalize_tool_result(content: Any) -> str:
     if isinstance(content, str):
         return content
     if isinstance(content, list):
+        # Filter empties while collecting so join gets the final list
+        # directly (str.join materialises a generator into a list anyway).
         parts: list[str] = []
         for item in content:
-            if isinstance(item, dict):
-                text = item.get("text")
-                if isinstance(text, str) and text:
-                    parts.append(text)
-            elif isinstance(item, str):
-                parts.append(item)
-        return "\n".join(part for part in parts if part)
+            text = item.get("text") if isinstance(item, dict) else item
+            if isinstance(text, str) and text:
+                parts.append(text)
+        return "\n".join(parts)
     if isinstance(content, dict):
         text = content.get("text")
         if isinstance(text, str):
@@ -762,6 +773,10 @@ def _normalize_tool_result(content: Any) -> str:
 def _coerce_comma_list(value: Any) -> str | None:
     if value is None:
         return None
+    # Fast path for the usual ``allowed_tools`` shape: a list of non-empty
+    # strings joins directly without the str()/filter passes below.
+    if type(value) is list and all(type(item) is str and item for item in value):
+        return ",".join(value) or None
     if isinstance(value, (list, tuple, set)):
         parts = [str(item) for item in value if item is not None]
         joined = ",".join(part for part in parts if part)
@@ -770,10 +785,13 @@ def _coerce_comma_list(value: Any) -> str | None:
     return text or None
 
 
-def _tool_kind_and_title(
-    name: str, tool_input: dict[str, Any]
-) -> tuple[ActionKind, str]:
-    return tool_kind_and_title(name, tool_input, path_keys=("file_path", "path"))
+_PATH_KEYS = ("file_path", "path")
+# Tool input fields echoed in the approval prompt, in display order.
+_CONTROL_DISPLAY_KEYS = ("file_path", "path", "command", "pattern")
+
+# Bound once so every tool_use block skips the extra wrapper frame.
+_tool_kind_and_title = functools.partial(tool_kind_and_title, path_keys=_PATH_KEYS)
+_tool_input_path = functools.partial(tool_input_path, path_keys=_PATH_KEYS)
 
 
 def _tool_action(
@@ -795,7 +813,7 @@ def _tool_action(
         detail["parent_tool_use_id"] = parent_tool_use_id
 
     if kind == "file_change":
-        path = tool_input_path(tool_input, path_keys=("file_path", "path"))
+        path = _tool_input_path(tool_input)
         if path:
             detail["changes"] = [{"path": path, "kind": "update"}]
 
@@ -1308,6 +1326,11 @@ def background_task_summary(state: ClaudeStreamState) -> str | None:
     return "⏳ " + " · ".join(parts)
 
 
+# Tool results can be whole files or long command logs; only the tail is
+# rendered (BashOutput shows the last line), so keep that much.
+_RESULT_PREVIEW_MAX_CHARS = 2048
+
+
 def _tool_result_event(
     content: claude_schema.StreamToolResultBlock,
     *,
@@ -1318,13 +1341,14 @@ def _tool_result_event(
     raw_result = content.content
     normalized = _normalize_tool_result(raw_result)
     preview = normalized
-
-    detail = action.detail | {
-        "tool_use_id": content.tool_use_id,
-        "result_preview": preview,
-        "result_len": len(normalized),
-        "is_error": is_error,
-    }
+    if len(preview) > _RESULT_PREVIEW_MAX_CHARS:
+        preview = "…" + preview[-(_RESULT_PREVIEW_MAX_CHARS - 1) :]
+
+    detail = action.detail.copy()
+    detail["tool_use_id"] = content.tool_use_id
+    detail["result_preview"] = preview
+    detail["result_len"] = len(normalized)
+    detail["is_error"] = is_error
     return factory.action_completed(
         action_id=action.id,
         kind=action.kind,
@@ -1667,16 +1691,12 @@ def _capture_mcp_catalog(
 
 def _usage_payload(event: claude_schema.StreamResultMessage) -> dict[str, Any]:
     usage: dict[str, Any] = {}
-    for key in (
-        "total_cost_usd",
-        "duration_ms",
-        "duration_api_ms",
-        "num_turns",
-        "subtype",
-    ):
-        value = getattr(event, key, None)
-        if value is not None:
-            usage[key] = value
+    if event.total_cost_usd is not None:
+        usage["total_cost_usd"] = event.total_cost_usd
+    usage["duration_ms"] = event.duration_ms
+    usage["duration_api_ms"] = event.duration_api_ms
+    usage["num_turns"] = event.num_turns
+    usage["subtype"] = event.subtype
     if event.usage is not None:
         usage["usage"] = event.usage
     return usage
@@ -1736,6 +1756,68 @@ def _capture_orphan_descendants(
         )
 
 
+_APPROVE_BUTTON_TEXT = "✅ Approve"
+_DENY_BUTTON_TEXT = "❌ Deny"
+_APPROVE_CALLBACK_PREFIX = "claude_control:approve:"
+_DENY_CALLBACK_PREFIX = "claude_control:deny:"
+
+
+def _approval_button_row(request_id: str) -> list[dict[str, str]]:
+    """Approve/Deny row for an interactive control request.
+
+    Returns fresh containers: callers append rows (ExitPlanMode) or clear
+    them (AskUserQuestion options) after building the keyboard.
+    """
+    return [
+        {
+            "text": _APPROVE_BUTTON_TEXT,
+            "callback_data": _APPROVE_CALLBACK_PREFIX + request_id,
+        },
+        {
+            "text": _DENY_BUTTON_TEXT,
+            "callback_data": _DENY_CALLBACK_PREFIX + request_id,
+        },
+    ]
+
+
+# Control requests acknowledged without user interaction; see the #380
+# safety notes in translate_claude_event's StreamControlRequest arm.
+_AUTO_APPROVE_TYPES: tuple[type[msgspec.Struct], ...] = (
+    claude_schema.ControlInitializeRequest,
+    claude_schema.ControlHookCallbackRequest,
+    claude_schema.ControlMcpMessageRequest,
+    claude_schema.ControlRewindFilesRequest,
+    claude_schema.ControlInterruptRequest,
+)
+
+
+def _strip_control_name(cls: type) -> str:
+    return cls.__name__.replace("Control", "").replace("Request", "")
+
+
+# Display label per control request type ("CanUseTool", "Initialize", ...).
+_CONTROL_LABELS: dict[type, str] = {
+    cls: _strip_control_name(cls)
+    for cls in (
+        claude_schema.ControlInterruptRequest,
+        claude_schema.ControlCanUseToolRequest,
+        claude_schema.ControlInitializeRequest,
+        claude_schema.ControlSetPermissionModeRequest,
+        claude_schema.ControlHookCallbackRequest,
+        claude_schema.ControlMcpMessageRequest,
+        claude_schema.ControlRewindFilesRequest,
+    )
+}
+
+
+def _control_label(request: object) -> str:
+    cls = type(request)
+    label = _CONTROL_LABELS.get(cls)
+    if label is None:
+        label = _strip_control_name(cls)
+    return label
+
+
 def translate_claude_event(
     event: claude_schema.StreamJsonMessage,
     *,
@@ -1761,18 +1843,20 @@ def translate_claude_event(
             # #365 capture MCP catalog snapshot + log init-time staleness.
             _capture_mcp_catalog(state, session_id, event.mcp_servers)
             meta: dict[str, Any] = {}
-            for key in (
-                "cwd",
-                "model",
-                "tools",
-                "permissionMode",
-                "output_style",
-                "apiKeySource",
-                "mcp_servers",
-            ):
-                value = getattr(event, key, None)
-                if value is not None:
-                    meta[key] = value
+            if event.cwd is not None:
+                meta["cwd"] = event.cwd
+            if event.model is not None:
+                meta["model"] = event.model
+            if event.tools is not None:
+                meta["tools"] = event.tools
+            if event.permissionMode is not None:
+                meta["permissionMode"] = event.permissionMode
+            if event.output_style is not None:
+                meta["output_style"] = event.output_style
+            if event.apiKeySource is not None:
+                meta["apiKeySource"] = event.apiKeySource
+            if event.mcp_servers is not None:
+                meta["mcp_servers"] = event.mcp_servers
             run_options = get_run_options()
             if run_options is not None and run_options.reasoning:
                 meta["effort"] = run_options.reasoning
@@ -2028,6 +2112,10 @@ def translate_claude_event(
             )
             return events_out
         case claude_schema.StreamControlRequest(request_id=request_id, request=request):
+            # One clock read per control request: used for the pending-request
+            # timestamp and the expiry sweep below. Monotonic, since only
+            # ages are compared and a wall-clock step must not expire them.
+            now = time.monotonic()
             # Auto-approve non-user-facing control requests.
             #
             # #380 — security audit (2026-04-27) verified the safety invariant
@@ -2068,17 +2156,8 @@ def translate_claude_event(
             # tests/test_claude_control.py::TestAutoApproveSafetyInvariant
             # lock in the expectation that auto-approve runs without
             # invoking any callback that observes the payload.
-            _AUTO_APPROVE_TYPES = (
-                claude_schema.ControlInitializeRequest,
-                claude_schema.ControlHookCallbackRequest,
-                claude_schema.ControlMcpMessageRequest,
-                claude_schema.ControlRewindFilesRequest,
-                claude_schema.ControlInterruptRequest,
-            )
             if isinstance(request, _AUTO_APPROVE_TYPES):
-                request_type = (
-                    type(request).__name__.replace("Control", "").replace("Request", "")
-                )
+                request_type = _control_label(request)
                 logger.debug(
                     "control_request.auto_approve",
                     request_id=request_id,
@@ -2249,7 +2328,7 @@ def translate_claude_event(
                             # registration at line ~779.
                             state.pending_control_requests[request_id] = (
                                 event,
-                                time.time(),
+                                now,
                             )
                             _REQUEST_TO_SESSION[request_id] = session_id
                             _REQUEST_TO_INPUT[request_id] = getattr(
@@ -2332,9 +2411,7 @@ def translate_claude_event(
                         ]
 
             # Phase 2: Interactive control request with inline keyboard
-            request_type = (
-                type(request).__name__.replace("Control", "").replace("Request", "")
-            )
+            request_type = _control_label(request)
 
             # Extract details based on request type
             details = ""
@@ -2346,7 +2423,7 @@ def translate_claude_event(
                 # Include key input parameters if available
                 if tool_input:
                     key_params = []
-                    for key in ["file_path", "path", "command", "pattern"]:
+                    for key in _CONTROL_DISPLAY_KEYS:
                         if key in tool_input:
                             value = str(tool_input[key])
                             if len(value) > 50:
@@ -2372,7 +2449,7 @@ def translate_claude_event(
                 warning_text += f"\n{diff_preview}"
 
             # Store in pending requests with timestamp
-            state.pending_control_requests[request_id] = (event, time.time())
+            state.pending_control_requests[request_id] = (event, now)
 
             # Phase 2: Register request_id -> session_id mapping for callback routing
             if factory.resume:
@@ -2431,13 +2508,15 @@ def translate_claude_event(
             # Send auto-deny to unblock the subprocess — without this,
             # Claude Code blocks forever waiting for a response that never comes.
             # See: https://github.com/banteg/takopi/issues/215
-            current_time = time.time()
-            expired = [
-                rid
-                for rid, (_, timestamp) in state.pending_control_requests.items()
-                if current_time - timestamp > CONTROL_REQUEST_TIMEOUT_SECONDS
-                and rid not in _HANDLED_REQUESTS  # belt-and-suspenders (#229)
-            ]
+            # Requests are inserted in arrival order, so the dict is also
+            # ordered by timestamp: stop at the first one still in time
+            # instead of scanning every pending request on each event.
+            expired: list[str] = []
+            for rid, (_, timestamp) in state.pending_control_requests.items():
+                if now - timestamp <= CONTROL_REQUEST_TIMEOUT_SECONDS:
+                    break
+                if rid not in _HANDLED_REQUESTS:  # belt-and-suspenders (#229)
+                    expired.append(rid)
             for rid in expired:
                 del state.pending_control_requests[rid]
                 _REQUEST_TO_INPUT.pop(rid, None)
@@ -2465,18 +2544,7 @@ def translate_claude_event(
             state.request_to_action[request_id] = action_id
 
             # Include inline keyboard data in detail
-            button_rows: list[list[dict[str, str]]] = [
-                [
-                    {
-                        "text": "✅ Approve",
-                        "callback_data": f"claude_control:approve:{request_id}",
-                    },
-                    {
-                        "text": "❌ Deny",
-                        "callback_data": f"claude_control:deny:{request_id}",
-                    },
-                ],
-            ]
+            button_rows = [_approval_button_row(request_id)]
             # ExitPlanMode gets an extra "Outline Plan" button
             if isinstance(request, claude_schema.ControlCanUseToolRequest):
                 tool_name = getattr(request, "tool_name", "")
@@ -2697,6 +2765,7 @@ def translate_claude_event(
 class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
     engine: EngineId = ENGINE
     resume_re: re.Pattern[str] = _RESUME_RE
+    resume_prefilter: str | None = "claude"
 
     claude_cmd: str = "claude"
     model: str | None = None
@@ -2749,7 +2818,10 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
 
     def _effective_permission_mode(self) -> str | None:
         """Resolve effective permission mode from per-chat override or engine config."""
-        run_options = get_run_options()
+        return self._permission_mode_for(get_run_options())
+
+    def _permission_mode_for(self, run_options: EngineRunOptions | None) -> str | None:
+        """Like ``_effective_permission_mode`` for callers already holding the options."""
         return (
             run_options.permission_mode if run_options else None
         ) or self.permission_mode
@@ -2792,7 +2864,7 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
             },
         }
 
-        jsonl_line = json.dumps(response) + "\n"
+        jsonl_line = _JSON_ENCODER.encode(response) + b"\n"
 
         # Look up the session-specific stdin from _SESSION_STDIN
         session_id = _REQUEST_TO_SESSION.get(request_id)
@@ -2802,7 +2874,7 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
         stdin_to_use = session_stdin or self._proc_stdin
         if stdin_to_use is not None:
             try:
-                await stdin_to_use.send(jsonl_line.encode())
+                await stdin_to_use.send(jsonl_line)
                 logger.info(
                     "control_response.sent",
                     request_id=request_id,
@@ -2835,7 +2907,7 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
                 return False
         elif self._pty_master_fd is not None:
             try:
-                os.write(self._pty_master_fd, jsonl_line.encode())
+                os.write(self._pty_master_fd, jsonl_line)
                 logger.info(
                     "control_response.sent",
                     request_id=request_id,
@@ -2877,34 +2949,20 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
 
     def _build_args(self, prompt: str, resume: ResumeToken | None) -> list[str]:
         run_options = get_run_options()
-        effective_mode = self._effective_permission_mode()
+        effective_mode = self._permission_mode_for(run_options)
 
         # When using permission mode with control channel, don't use -p mode.
         # The SDK-style streaming protocol requires bidirectional stdin/stdout
         # without -p. The prompt is sent as a JSON user message on stdin.
-        if effective_mode is not None:
-            args: list[str] = [
-                "--output-format",
-                "stream-json",
-                "--input-format",
-                "stream-json",
-                "--verbose",
-            ]
-        else:
-            args = [
-                "-p",
-                "--output-format",
-                "stream-json",
-                "--input-format",
-                "stream-json",
-                "--verbose",
-            ]
-
+        #
         # User-supplied CLI flags (e.g. `--chrome` to opt into Claude-in-Chrome).
         # Must sit after the Untether-managed I/O prelude but before
         # resume / model / effort / allowed-tools / permission so the final
         # prompt position (after `--`) is never displaced (#407).
-        args.extend(self.extra_args)
+        if effective_mode is not None:
+            args: list[str] = [*_STREAM_JSON_ARGS, *self.extra_args]
+        else:
+            args = ["-p", *_STREAM_JSON_ARGS, *self.extra_args]
 
         if resume is not None:
             if resume.is_continue:
@@ -2929,12 +2987,12 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
 
         if effective_mode is not None:
             cli_mode = "plan" if effective_mode == "auto" else effective_mode
-            args.extend(["--permission-mode", cli_mode])
-            args.extend(["--permission-prompt-tool", "stdio"])
+            args.extend(
+                ("--permission-mode", cli_mode, "--permission-prompt-tool", "stdio")
+            )
             # Prompt sent via stdin as JSON, not as CLI arg
         else:
-            args.append("--")
-            args.append(prompt)
+            args.extend(("--", prompt))
 
         return args
 
@@ -2975,8 +3033,12 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
                 },
                 "parent_tool_use_id": None,
             }
-            payload = json.dumps(init_request) + "\n" + json.dumps(user_message) + "\n"
-            return payload.encode()
+            return (
+                _JSON_ENCODER.encode(init_request)
+                + b"\n"
+                + _JSON_ENCODER.encode(user_message)
+                + b"\n"
+            )
         return None
 
     def env(self, *, state: Any) -> dict[str, str] | None:
@@ -3070,7 +3132,7 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
             and not resume.is_continue
             and self.supports_control_channel
         ):
-            _ACTIVE_RUNNERS[resume.value] = (self, time.time())
+            _ACTIVE_RUNNERS[resume.value] = (self, time.monotonic())
             logger.info(
                 "claude_runner.registered",
                 session_id=resume.value,
@@ -3169,13 +3231,20 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
                 yield evt
             # Drain auto-approve and auto-deny queues after EVERY line, even if no events
             # were yielded.  This prevents deadlock when auto-handled requests produce no events.
-            await self._drain_auto_approve(state, stdin=session_stdin)
-            await self._drain_auto_deny(state, stdin=session_stdin)
-            # #365 fire-and-forget mcp_status control_requests queued by
-            # translate_claude_event on tool_result. Drain last so the
-            # response (if any) arrives after Claude has processed the
-            # tool_result itself.
-            await self._drain_catalog_refresh(state, stdin=session_stdin)
+            # Most lines queue nothing, so only enter the drains when
+            # translation actually queued a response.
+            if (
+                state.auto_approve_queue
+                or state.auto_deny_queue
+                or state.pending_catalog_refresh_ids
+            ):
+                await self._drain_auto_approve(state, stdin=session_stdin)
+                await self._drain_auto_deny(state, stdin=session_stdin)
+                # #365 fire-and-forget mcp_status control_requests queued by
+                # translate_claude_event on tool_result. Drain last so the
+                # response (if any) arrives after Claude has processed the
+                # tool_result itself.
+                await self._drain_catalog_refresh(state, stdin=session_stdin)
             # After CompletedEvent, stop reading stdout immediately.
             # Claude Code's MCP server child processes may inherit the stdout pipe FD,
             # keeping it open even after Claude Code exits. Without this break,
@@ -3192,7 +3261,15 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
 
         # Use provided stdin (session-specific) or fall back to instance
         pipe = stdin or self._proc_stdin
-        for req_id in state.auto_approve_queue:
+        queue = state.auto_approve_queue
+        # Approvals arrive in bursts (initialize + hook callbacks); write
+        # them as one JSONL batch so a burst costs a single send (or a single
+        # writev on the PTY, which skips joining the lines).
+        req_ids: list[str] = []
+        chunks: list[bytes] = []
+        while queue:
+            req_id = queue.popleft()
+            req_ids.append(req_id)
             inner: dict[str, Any] = {"behavior": "allow"}
             if req_id in _REQUEST_TO_INPUT:
                 inner["updatedInput"] = _REQUEST_TO_INPUT.pop(req_id)
@@ -3204,33 +3281,34 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
                     "response": inner,
                 },
             }
-            payload = (json.dumps(response) + "\n").encode()
-            try:
-                if pipe is not None:
-                    await pipe.send(payload)
-                    logger.info(
-                        "control_response.auto_approved",
-                        request_id=req_id,
-                        channel="pipe",
-                    )
-                elif self._pty_master_fd is not None:
-                    os.write(self._pty_master_fd, payload)
-                    logger.info(
-                        "control_response.auto_approved",
-                        request_id=req_id,
-                        channel="pty",
-                    )
-                else:
+            chunks.append(_JSON_ENCODER.encode(response) + b"\n")
+        try:
+            if pipe is not None:
+                await pipe.send(b"".join(chunks))
+                channel = "pipe"
+            elif self._pty_master_fd is not None:
+                os.writev(self._pty_master_fd, chunks)
+                channel = "pty"
+            else:
+                for req_id in req_ids:
                     logger.warning(
                         "control_response.auto_approve_failed", request_id=req_id
                     )
-            except (OSError, anyio.ClosedResourceError) as e:
+                return
+        except (OSError, anyio.ClosedResourceError) as e:
+            for req_id in req_ids:
                 logger.warning(
                     "control_response.auto_approve_failed",
                     request_id=req_id,
                     error=str(e),
                 )
-        state.auto_approve_queue.clear()
+            return
+        for req_id in req_ids:
+            logger.info(
+                "control_response.auto_approved",
+                request_id=req_id,
+                channel=channel,
+            )
 
     async def _drain_auto_deny(
         self, state: ClaudeStreamState, *, stdin: Any = None
@@ -3249,7 +3327,7 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
                     "response": {"behavior": "deny", "message": message},
                 },
             }
-            payload = (json.dumps(response) + "\n").encode()
+            payload = _JSON_ENCODER.encode(response) + b"\n"
             try:
                 if pipe is not None:
                     await pipe.send(payload)
@@ -3300,7 +3378,7 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
                 "request_id": req_id,
                 "request": {"subtype": "mcp_status"},
             }
-            payload = (json.dumps(request) + "\n").encode()
+            payload = _JSON_ENCODER.encode(request) + b"\n"
             try:
                 if pipe is not None:
                     await pipe.send(payload)
@@ -4154,7 +4232,7 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
             for evt in events:
                 if isinstance(evt, StartedEvent) and evt.resume:
                     session_id = evt.resume.value
-                    _ACTIVE_RUNNERS[session_id] = (self, time.time())
+                    _ACTIVE_RUNNERS[session_id] = (self, time.monotonic())
                     logger.debug(
                         "claude_runner.registered",
                         session_id=session_id,
@@ -4312,7 +4390,11 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
                 # SDK-style: use PIPE stdin, keep it open for control responses
                 stdin_arg = subprocess_module.PIPE
             elif self.supports_control_channel and os.name == "posix":
-                # Legacy: use PTY for stdin
+                # Legacy: use PTY for stdin. Imported here so permission-mode
+                # runs (and non-POSIX hosts) never load termios.
+                import pty
+                import tty
+
                 pty_master_fd, pty_slave_fd = pty.openpty()
                 run_logger.debug(
                     "pty.opened", master_fd=pty_master_fd, slave_fd=pty_slave_fd
@@ -4619,8 +4701,29 @@ class ClaudeRunner(ResumeTokenMixin, JsonlSubprocessRunner):
             self._pty_master_fd = None
 
 
+# PATH -> resolved `claude` binary. Only hits are cached, so installing the
+# CLI after startup is still picked up by the next build_runner.
+_CLAUDE_CMD_CACHE: dict[str, str] = {}
+
+
+def clear_claude_cmd_cache() -> None:
+    _CLAUDE_CMD_CACHE.clear()
+
+
+def _resolve_claude_cmd() -> str:
+    path_env = os.environ.get("PATH", "")
+    cached = _CLAUDE_CMD_CACHE.get(path_env)
+    if cached is not None:
+        return cached
+    resolved = shutil.which("claude")
+    if resolved is None:
+        return "claude"
+    _CLAUDE_CMD_CACHE[path_env] = resolved
+    return resolved
+
+
 def build_runner(config: EngineConfig, config_path: Path) -> Runner:
-    claude_cmd = shutil.which("claude") or "claude"
+    claude_cmd = _resolve_claude_cmd()
 
     model = config.get("model")
     if "allowed_tools" in config:
@@ -4694,8 +4797,10 @@ async def send_claude_control_response(
     Returns:
         True if the response was sent successfully, False if the request is not found
     """
-    # Look up session_id from request_id
-    if request_id not in _REQUEST_TO_SESSION:
+    # Look up session_id from request_id. The mapping is only dropped after
+    # the write: write_control_response reads it to find the session stdin.
+    session_id = _REQUEST_TO_SESSION.get(request_id)
+    if session_id is None:
         # Duplicate callback (Telegram long-polling can deliver the same update twice)
         if request_id in _HANDLED_REQUESTS:
             logger.debug("control_response.duplicate", request_id=request_id)
@@ -4706,27 +4811,27 @@ async def send_claude_control_response(
         )
         return False
 
-    session_id = _REQUEST_TO_SESSION[request_id]
-
-    if session_id not in _ACTIVE_RUNNERS:
+    entry = _ACTIVE_RUNNERS.get(session_id)
+    if entry is None:
         logger.warning(
             "control_response.no_active_session",
             session_id=session_id,
             request_id=request_id,
         )
         # Clean up stale mappings
-        del _REQUEST_TO_SESSION[request_id]
+        _REQUEST_TO_SESSION.pop(request_id, None)
         _REQUEST_TO_INPUT.pop(request_id, None)
         _REQUEST_TO_TOOL_NAME.pop(request_id, None)
         return False
 
-    runner, _ = _ACTIVE_RUNNERS[session_id]
+    runner, _ = entry
     success = await runner.write_control_response(
         request_id, approved, deny_message=deny_message
     )
 
-    # Clean up the mapping after use
-    del _REQUEST_TO_SESSION[request_id]
+    # Clean up the mapping after use. pop: a duplicate callback delivered
+    # during the await above may already have removed it.
+    _REQUEST_TO_SESSION.pop(request_id, None)
     # #197: LRU-evict oldest entries instead of clear()-ing the whole set.
     _HANDLED_REQUESTS[request_id] = None
     _HANDLED_REQUESTS.move_to_end(request_id)
@@ -4897,7 +5002,7 @@ def cleanup_expired_sessions(max_age_seconds: float = 3600.0) -> int:
     Returns:
         Number of sessions cleaned up
     """
-    current_time = time.time()
+    current_time = time.monotonic()
     expired = [
         session_id
         for session_id, (_, timestamp) in _ACTIVE_RUNNERS.items()
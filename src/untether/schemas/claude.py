@@ -1,4 +1,8 @@
-"""Msgspec models and decoder for Claude Code stream-json output."""
+"""Msgspec models and decoder for Claude Code stream-json output.
+
+Every model is declared with ``gc=False``: decoded events are short-lived,
+acyclic trees, so there is no need for the cycle collector to track them.
+"""
 
 from __future__ import annotations
 
@@ -8,20 +12,28 @@ import msgspec
 
 
 class StreamTextBlock(
-    msgspec.Struct, tag="text", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct, gc=False, tag="text", tag_field="type", forbid_unknown_fields=False
 ):
     text: str
 
 
 class StreamThinkingBlock(
-    msgspec.Struct, tag="thinking", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="thinking",
+    tag_field="type",
+    forbid_unknown_fields=False,
 ):
     thinking: str
     signature: str
 
 
 class StreamToolUseBlock(
-    msgspec.Struct, tag="tool_use", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="tool_use",
+    tag_field="type",
+    forbid_unknown_fields=False,
 ):
     id: str
     name: str
@@ -29,7 +41,11 @@ class StreamToolUseBlock(
 
 
 class StreamToolResultBlock(
-    msgspec.Struct, tag="tool_result", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="tool_result",
+    tag_field="type",
+    forbid_unknown_fields=False,
 ):
     tool_use_id: str
     # #501 — Claude Code may emit `content` as a single content block
@@ -45,6 +61,7 @@ class StreamToolResultBlock(
 # emit `server_tool_use` content blocks. Structurally identical to `tool_use`.
 class StreamServerToolUseBlock(
     msgspec.Struct,
+    gc=False,
     tag="server_tool_use",
     tag_field="type",
     forbid_unknown_fields=False,
@@ -58,6 +75,7 @@ class StreamServerToolUseBlock(
 # to `tool_result`.
 class StreamAdvisorToolResultBlock(
     msgspec.Struct,
+    gc=False,
     tag="advisor_tool_result",
     tag_field="type",
     forbid_unknown_fields=False,
@@ -75,7 +93,7 @@ class StreamAdvisorToolResultBlock(
 # payload is never rendered, the schema just needs to accept the line so the
 # rest of the event isn't dropped (jsonl.msgspec.invalid x23 on nsd).
 class StreamImageBlock(
-    msgspec.Struct, tag="image", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct, gc=False, tag="image", tag_field="type", forbid_unknown_fields=False
 ):
     source: dict[str, Any] | None = None
 
@@ -83,7 +101,11 @@ class StreamImageBlock(
 # #597 — see StreamImageBlock; PDFs and other documents use the same shape
 # plus optional metadata fields (title, context, citations toggle).
 class StreamDocumentBlock(
-    msgspec.Struct, tag="document", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="document",
+    tag_field="type",
+    forbid_unknown_fields=False,
 ):
     source: dict[str, Any] | None = None
     title: str | None = None
@@ -101,12 +123,12 @@ type StreamContentBlock = (
 )
 
 
-class StreamUserMessageBody(msgspec.Struct, forbid_unknown_fields=False):
+class StreamUserMessageBody(msgspec.Struct, gc=False, forbid_unknown_fields=False):
     role: Literal["user"]
     content: str | list[StreamContentBlock]
 
 
-class StreamAssistantMessageBody(msgspec.Struct, forbid_unknown_fields=False):
+class StreamAssistantMessageBody(msgspec.Struct, gc=False, forbid_unknown_fields=False):
     role: Literal["assistant"]
     content: list[StreamContentBlock]
     model: str
@@ -114,7 +136,7 @@ class StreamAssistantMessageBody(msgspec.Struct, forbid_unknown_fields=False):
 
 
 class StreamUserMessage(
-    msgspec.Struct, tag="user", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct, gc=False, tag="user", tag_field="type", forbid_unknown_fields=False
 ):
     message: StreamUserMessageBody
     uuid: str | None = None
@@ -123,7 +145,11 @@ class StreamUserMessage(
 
 
 class StreamAssistantMessage(
-    msgspec.Struct, tag="assistant", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="assistant",
+    tag_field="type",
+    forbid_unknown_fields=False,
 ):
     message: StreamAssistantMessageBody
     parent_tool_use_id: str | None = None
@@ -132,7 +158,11 @@ class StreamAssistantMessage(
 
 
 class StreamSystemMessage(
-    msgspec.Struct, tag="system", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="system",
+    tag_field="type",
+    forbid_unknown_fields=False,
 ):
     subtype: str
     session_id: str | None = None
@@ -147,7 +177,11 @@ class StreamSystemMessage(
 
 
 class StreamResultMessage(
-    msgspec.Struct, tag="result", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="result",
+    tag_field="type",
+    forbid_unknown_fields=False,
 ):
     subtype: str
     duration_ms: int
@@ -162,7 +196,11 @@ class StreamResultMessage(
 
 
 class StreamEventMessage(
-    msgspec.Struct, tag="stream_event", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="stream_event",
+    tag_field="type",
+    forbid_unknown_fields=False,
 ):
     uuid: str
     session_id: str
@@ -171,13 +209,21 @@ class StreamEventMessage(
 
 
 class ControlInterruptRequest(
-    msgspec.Struct, tag="interrupt", tag_field="subtype", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="interrupt",
+    tag_field="subtype",
+    forbid_unknown_fields=False,
 ):
     pass
 
 
 class ControlCanUseToolRequest(
-    msgspec.Struct, tag="can_use_tool", tag_field="subtype", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="can_use_tool",
+    tag_field="subtype",
+    forbid_unknown_fields=False,
 ):
     tool_name: str
     input: dict[str, Any]
@@ -186,13 +232,18 @@ class ControlCanUseToolRequest(
 
 
 class ControlInitializeRequest(
-    msgspec.Struct, tag="initialize", tag_field="subtype", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="initialize",
+    tag_field="subtype",
+    forbid_unknown_fields=False,
 ):
     hooks: dict[str, Any] | None = None
 
 
 class ControlSetPermissionModeRequest(
     msgspec.Struct,
+    gc=False,
     tag="set_permission_mode",
     tag_field="subtype",
     forbid_unknown_fields=False,
@@ -202,6 +253,7 @@ class ControlSetPermissionModeRequest(
 
 class ControlHookCallbackRequest(
     msgspec.Struct,
+    gc=False,
     tag="hook_callback",
     tag_field="subtype",
     forbid_unknown_fields=False,
@@ -212,14 +264,22 @@ class ControlHookCallbackRequest(
 
 
 class ControlMcpMessageRequest(
-    msgspec.Struct, tag="mcp_message", tag_field="subtype", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="mcp_message",
+    tag_field="subtype",
+    forbid_unknown_fields=False,
 ):
     server_name: str
     message: Any
 
 
 class ControlRewindFilesRequest(
-    msgspec.Struct, tag="rewind_files", tag_field="subtype", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="rewind_files",
+    tag_field="subtype",
+    forbid_unknown_fields=False,
 ):
     user_message_id: str
 
@@ -236,21 +296,33 @@ type ControlRequest = (
 
 
 class StreamControlRequest(
-    msgspec.Struct, tag="control_request", tag_field="type", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="control_request",
+    tag_field="type",
+    forbid_unknown_fields=False,
 ):
     request_id: str
     request: ControlRequest
 
 
 class ControlSuccessResponse(
-    msgspec.Struct, tag="success", tag_field="subtype", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="success",
+    tag_field="subtype",
+    forbid_unknown_fields=False,
 ):
     request_id: str
     response: dict[str, Any] | None = None
 
 
 class ControlErrorResponse(
-    msgspec.Struct, tag="error", tag_field="subtype", forbid_unknown_fields=False
+    msgspec.Struct,
+    gc=False,
+    tag="error",
+    tag_field="subtype",
+    forbid_unknown_fields=False,
 ):
     request_id: str
     error: str
@@ -261,6 +333,7 @@ type ControlResponse = ControlSuccessResponse | ControlErrorResponse
 
 class StreamControlResponse(
     msgspec.Struct,
+    gc=False,
     tag="control_response",
     tag_field="type",
     forbid_unknown_fields=False,
@@ -270,6 +343,7 @@ class StreamControlResponse(
 
 class StreamControlCancelRequest(
     msgspec.Struct,
+    gc=False,
     tag="control_cancel_request",
     tag_field="type",
     forbid_unknown_fields=False,
@@ -277,7 +351,7 @@ class StreamControlCancelRequest(
     request_id: str | None = None
 
 
-class RateLimitInfo(msgspec.Struct, forbid_unknown_fields=False):
+class RateLimitInfo(msgspec.Struct, gc=False, forbid_unknown_fields=False):
     requests_limit: int | None = None
     requests_remaining: int | None = None
     requests_reset: str | None = None
@@ -289,6 +363,7 @@ class RateLimitInfo(msgspec.Struct, forbid_unknown_fields=False):
 
 class StreamRateLimitMessage(
     msgspec.Struct,
+    gc=False,
     tag="rate_limit_event",
     tag_field="type",
     forbid_unknown_fields=False,
@@ -314,6 +389,7 @@ class StreamRateLimitMessage(
 # time from Untether's own clock).
 class StreamToolProgressMessage(
     msgspec.Struct,
+    gc=False,
     tag="tool_progress",
     tag_field="type",
     forbid_unknown_fields=False,
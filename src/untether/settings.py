@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import re
+import stat
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Annotated, Any, ClassVar, Literal
@@ -25,6 +26,7 @@ from .config import (
     ConfigError,
     ProjectConfig,
     ProjectsConfig,
+    stat_config,
 )
 from .config_migrations import migrate_config_file
 from .logging import get_logger
@@ -863,25 +865,66 @@ class UntetherSettings(BaseSettings):
         )
 
 
+# Parsed settings keyed by config path.  ``load_settings_if_exists`` is
+# called by several per-message helpers (footer, watchdog, preamble, budget,
+# ...), so re-running migrations and the TOML/pydantic parse on every call
+# is pure overhead while the file is unchanged.  Entries are validated
+# against the raw file bytes plus the ``UNTETHER__*`` env overrides the
+# settings model reads.  Comparing content rather than stat metadata means a
+# same-size rewrite inside the filesystem's mtime granularity still
+# invalidates the entry; reading a few KB is cheap next to the parse.
+_SETTINGS_CACHE: dict[Path, tuple[tuple[object, ...], UntetherSettings]] = {}
+
+
+def clear_settings_cache() -> None:
+    _SETTINGS_CACHE.clear()
+
+
+def _settings_signature(cfg_path: Path) -> tuple[object, ...] | None:
+    try:
+        content = cfg_path.read_bytes()
+    except OSError:
+        return None
+    env = tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.startswith("UNTETHER__")
+        )
+    )
+    return (content, env)
+
+
+def _load_settings_cached(cfg_path: Path) -> UntetherSettings:
+    signature = _settings_signature(cfg_path)
+    cached = _SETTINGS_CACHE.get(cfg_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    if migrate_config_file(cfg_path):
+        # The migration rewrote the file; re-read for the new signature.
+        signature = _settings_signature(cfg_path)
+    settings = _load_settings_from_path(cfg_path)
+    if signature is not None:
+        _SETTINGS_CACHE[cfg_path] = (signature, settings)
+    return settings
+
+
 def load_settings(path: str | Path | None = None) -> tuple[UntetherSettings, Path]:
     cfg_path = _resolve_config_path(path)
     _ensure_config_file(cfg_path)
-    migrate_config_file(cfg_path)
-    return _load_settings_from_path(cfg_path), cfg_path
+    return _load_settings_cached(cfg_path), cfg_path
 
 
 def load_settings_if_exists(
     path: str | Path | None = None,
 ) -> tuple[UntetherSettings, Path] | None:
     cfg_path = _resolve_config_path(path)
-    if cfg_path.exists():
-        if not cfg_path.is_file():
-            raise ConfigError(
-                f"Config path {cfg_path} exists but is not a file."
-            ) from None
-        migrate_config_file(cfg_path)
-        return _load_settings_from_path(cfg_path), cfg_path
-    return None
+    st = stat_config(cfg_path)
+    if st is None:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        raise ConfigError(f"Config path {cfg_path} exists but is not a file.") from None
+    return _load_settings_cached(cfg_path), cfg_path
 
 
 def validate_settings_data(
@@ -913,11 +956,13 @@ def _resolve_config_path(path: str | Path | None) -> Path:
     return HOME_CONFIG_PATH
 
 
-def _ensure_config_file(cfg_path: Path) -> None:
-    if cfg_path.exists() and not cfg_path.is_file():
-        raise ConfigError(f"Config path {cfg_path} exists but is not a file.") from None
-    if not cfg_path.exists():
+def _ensure_config_file(cfg_path: Path) -> os.stat_result:
+    st = stat_config(cfg_path)
+    if st is None:
         raise ConfigError(f"Missing config file {cfg_path}.") from None
+    if not stat.S_ISREG(st.st_mode):
+        raise ConfigError(f"Config path {cfg_path} exists but is not a file.") from None
+    return st
 
 
 def _load_settings_from_path(cfg_path: Path) -> UntetherSettings:
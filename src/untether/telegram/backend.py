@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
@@ -180,6 +181,17 @@ def _build_startup_message(
     return header + "\n\n" + "\n\n".join(details) + footer
 
 
+def _event_loop_options() -> dict[str, object]:
+    """Run the bot loop on uvloop when it is installed.
+
+    uvloop is not a dependency; installing it alongside untether opts in to
+    its cheaper subprocess-pipe and socket I/O. anyio handles the rest.
+    """
+    if importlib.util.find_spec("uvloop") is None:
+        return {}
+    return {"use_uvloop": True}
+
+
 class TelegramBackend(TransportBackend):
     id = "telegram"
     description = "Telegram bot"
@@ -305,7 +317,7 @@ class TelegramBackend(TransportBackend):
                 transport_config=settings,
             )
 
-        anyio.run(run_loop)
+        anyio.run(run_loop, backend_options=_event_loop_options())
 
 
 telegram_backend = TelegramBackend()
@@ -30,20 +30,17 @@ def _parse_callback_data(data: str) -> tuple[str, str]:
 
     Format: command_id:args... -> (command_id, args...)
     """
-    parts = data.split(":", 1)
-    command_id = parts[0].lower()
+    head, _, args_text = data.partition(":")
+    command_id = head.lower()
     if not command_id:
         logger.warning("callback.parse_failed", data=data[:64])
-    args_text = parts[1] if len(parts) > 1 else ""
     return command_id, args_text
 
 
-async def _dispatch_command(
+def _command_executor_and_ref(
     cfg: TelegramBridgeConfig,
     msg: TelegramIncomingMessage,
-    text: str,
-    command_id: str,
-    args_text: str,
+    *,
     running_tasks: RunningTasks,
     scheduler: ThreadScheduler,
     on_thread_known: Callable[[ResumeToken, anyio.Event], Awaitable[None]] | None,
@@ -51,19 +48,7 @@ async def _dispatch_command(
     default_engine_override: EngineId | None,
     engine_overrides_resolver: Callable[[EngineId], Awaitable[EngineRunOptions | None]]
     | None,
-) -> None:
-    allowlist = cfg.runtime.allowlist
-    chat_id = msg.chat_id
-    user_msg_id = msg.message_id
-    reply_ref = (
-        MessageRef(
-            channel_id=chat_id,
-            message_id=msg.reply_to_message_id,
-            thread_id=msg.thread_id,
-        )
-        if msg.reply_to_message_id is not None
-        else None
-    )
+) -> tuple[_TelegramCommandExecutor, MessageRef]:
     executor = _TelegramCommandExecutor(
         exec_cfg=cfg.exec_cfg,
         runtime=cfg.runtime,
@@ -71,24 +56,55 @@ async def _dispatch_command(
         scheduler=scheduler,
         on_thread_known=on_thread_known,
         engine_overrides_resolver=engine_overrides_resolver,
-        chat_id=chat_id,
-        user_msg_id=user_msg_id,
+        chat_id=msg.chat_id,
+        user_msg_id=msg.message_id,
         thread_id=msg.thread_id,
         show_resume_line=cfg.show_resume_line,
         stateful_mode=stateful_mode,
         default_engine_override=default_engine_override,
     )
     message_ref = MessageRef(
-        channel_id=chat_id,
-        message_id=user_msg_id,
+        channel_id=msg.chat_id,
+        message_id=msg.message_id,
         thread_id=msg.thread_id,
         sender_id=msg.sender_id,
         raw=msg.raw,
     )
+    return executor, message_ref
+
+
+async def _dispatch_command(
+    cfg: TelegramBridgeConfig,
+    msg: TelegramIncomingMessage,
+    text: str,
+    command_id: str,
+    args_text: str,
+    running_tasks: RunningTasks,
+    scheduler: ThreadScheduler,
+    on_thread_known: Callable[[ResumeToken, anyio.Event], Awaitable[None]] | None,
+    stateful_mode: bool,
+    default_engine_override: EngineId | None,
+    engine_overrides_resolver: Callable[[EngineId], Awaitable[EngineRunOptions | None]]
+    | None,
+) -> None:
+    allowlist = cfg.runtime.allowlist
+    chat_id = msg.chat_id
     logger.info("command.dispatch", command=command_id, chat_id=chat_id)
+    # Resolve the backend before building the executor and refs so unknown
+    # commands return without allocating anything.
     try:
         backend = get_command(command_id, allowlist=allowlist, required=False)
     except ConfigError as exc:
+        executor, message_ref = _command_executor_and_ref(
+            cfg,
+            msg,
+            running_tasks=running_tasks,
+            scheduler=scheduler,
+            on_thread_known=on_thread_known,
+            stateful_mode=stateful_mode,
+            default_engine_override=default_engine_override,
+            engine_overrides_resolver=engine_overrides_resolver,
+        )
         # #201: don't send raw exception text to Telegram (may include paths,
         # URLs, or exception class names).
         await executor.send(
@@ -104,6 +120,16 @@ async def _dispatch_command(
             chat_id=chat_id,
         )
         return
+    executor, message_ref = _command_executor_and_ref(
+        cfg,
+        msg,
+        running_tasks=running_tasks,
+        scheduler=scheduler,
+        on_thread_known=on_thread_known,
+        stateful_mode=stateful_mode,
+        default_engine_override=default_engine_override,
+        engine_overrides_resolver=engine_overrides_resolver,
+    )
     try:
         plugin_config = cfg.runtime.plugin_config(command_id)
     except ConfigError as exc:
@@ -113,6 +139,15 @@ async def _dispatch_command(
             notify=True,
         )
         return
+    reply_ref = (
+        MessageRef(
+            channel_id=chat_id,
+            message_id=msg.reply_to_message_id,
+            thread_id=msg.thread_id,
+        )
+        if msg.reply_to_message_id is not None
+        else None
+    )
     ctx = CommandContext(
         command=command_id,
         text=text,
@@ -197,27 +232,6 @@ async def _dispatch_callback(
     allowlist = cfg.runtime.allowlist
     chat_id = msg.chat_id
     user_msg_id = msg.message_id
-    executor = _TelegramCommandExecutor(
-        exec_cfg=cfg.exec_cfg,
-        runtime=cfg.runtime,
-        running_tasks=running_tasks,
-        scheduler=scheduler,
-        on_thread_known=on_thread_known,
-        engine_overrides_resolver=None,
-        chat_id=chat_id,
-        user_msg_id=user_msg_id,
-        thread_id=thread_id,
-        show_resume_line=cfg.show_resume_line,
-        stateful_mode=stateful_mode,
-        default_engine_override=default_engine_override,
-    )
-    message_ref = MessageRef(
-        channel_id=chat_id,
-        message_id=user_msg_id,
-        thread_id=thread_id,
-        sender_id=msg.sender_id,
-        raw=msg.raw,
-    )
     dispatch_start = time.monotonic()
     logger.info("callback.dispatch", command=command_id, chat_id=chat_id)
     _answered = False
@@ -290,6 +304,30 @@ async def _dispatch_callback(
             # whole point. A None toast just means no toast text will appear.
             await _answer_callback(toast, early=True)
 
+        # Built only once a backend is known; after the early answer so it
+        # never delays clearing the spinner (#247).
+        executor = _TelegramCommandExecutor(
+            exec_cfg=cfg.exec_cfg,
+            runtime=cfg.runtime,
+            running_tasks=running_tasks,
+            scheduler=scheduler,
+            on_thread_known=on_thread_known,
+            engine_overrides_resolver=None,
+            chat_id=chat_id,
+            user_msg_id=user_msg_id,
+            thread_id=thread_id,
+            show_resume_line=cfg.show_resume_line,
+            stateful_mode=stateful_mode,
+            default_engine_override=default_engine_override,
+        )
+        message_ref = MessageRef(
+            channel_id=chat_id,
+            message_id=user_msg_id,
+            thread_id=thread_id,
+            sender_id=msg.sender_id,
+            raw=msg.raw,
+        )
+
         # For callbacks, text is the full callback data and args come from parsing
         text = msg.data or ""
         ctx = CommandContext(
@@ -330,22 +368,28 @@ async def _dispatch_callback(
                 if isinstance(cb_msg, RenderedMessage)
                 else RenderedMessage(text=cb_msg)
             )
-            if result.skip_reply:
-                # Send without reply_to — bypass executor default which
-                # would reply to the callback's message (possibly deleted).
-                sent_ref = await cfg.exec_cfg.transport.send(
-                    channel_id=chat_id,
-                    message=rendered,
-                    options=SendOptions(notify=result.notify, thread_id=thread_id),
-                )
-            else:
-                if result.reply_to is not None:
-                    reply_to = result.reply_to
+            # Clear the spinner while the reply is in flight rather than
+            # after it: both are independent Telegram round-trips, and
+            # answerCallbackQuery bypasses the per-chat outbox (#546).
+            async with anyio.create_task_group() as tg:
+                if not _answered:
+                    tg.start_soon(_answer_callback)
+                if result.skip_reply:
+                    # Send without reply_to — bypass executor default which
+                    # would reply to the callback's message (possibly deleted).
+                    sent_ref = await cfg.exec_cfg.transport.send(
+                        channel_id=chat_id,
+                        message=rendered,
+                        options=SendOptions(notify=result.notify, thread_id=thread_id),
+                    )
                 else:
-                    reply_to = message_ref
-                sent_ref = await executor.send(
-                    cb_msg, reply_to=reply_to, notify=result.notify
-                )
+                    if result.reply_to is not None:
+                        reply_to = result.reply_to
+                    else:
+                        reply_to = message_ref
+                    sent_ref = await executor.send(
+                        cb_msg, reply_to=reply_to, notify=result.notify
+                    )
             # Register feedback message for cleanup when the run finishes.
             if sent_ref is not None and callback_query_id is not None:
                 register_ephemeral_message(chat_id, user_msg_id, sent_ref)
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ...commands import CommandBackend, CommandContext, CommandResult
 from ...logging import get_logger
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ..chat_prefs import ChatPrefsStore
+    from ..engine_overrides import EngineOverrides
+
 logger = get_logger(__name__)
 
 PLANMODE_USAGE = (
@@ -12,6 +20,9 @@ PLANMODE_USAGE = (
     " `/planmode show`, or `/planmode clear`"
 )
 
+# CommandResult is frozen, so the fixed usage reply can be shared.
+_PLANMODE_USAGE_RESULT = CommandResult(text=PLANMODE_USAGE, notify=True)
+
 PERMISSION_MODES = {
     "on": "plan",
     "auto": "auto",
@@ -23,6 +34,45 @@ PERMISSION_MODES = {
 # they should use /config → Approval policy instead.
 _PLANMODE_ENGINES = frozenset({"claude"})
 
+# One store per prefs file. A store only re-reads the file when its mtime
+# changes, so reusing it spares repeated /planmode toggles a full parse.
+_PREFS_STORES: dict[Path, ChatPrefsStore] = {}
+
+
+def clear_prefs_stores() -> None:
+    _PREFS_STORES.clear()
+
+
+def _prefs_store(config_path: Path) -> ChatPrefsStore:
+    from ..chat_prefs import ChatPrefsStore, resolve_prefs_path
+
+    prefs_path = resolve_prefs_path(config_path)
+    store = _PREFS_STORES.get(prefs_path)
+    if store is None:
+        store = ChatPrefsStore(prefs_path)
+        _PREFS_STORES[prefs_path] = store
+    return store
+
+
+def _with_permission_mode(
+    current: EngineOverrides | None, mode: str | None
+) -> EngineOverrides:
+    """Copy of the chat's overrides with only ``permission_mode`` changed."""
+    from ..engine_overrides import EngineOverrides
+
+    return EngineOverrides(
+        model=current.model if current else None,
+        reasoning=current.reasoning if current else None,
+        permission_mode=mode,
+        ask_questions=current.ask_questions if current else None,
+        diff_preview=current.diff_preview if current else None,
+        show_api_cost=current.show_api_cost if current else None,
+        show_subscription_usage=current.show_subscription_usage if current else None,
+        show_resume_line=current.show_resume_line if current else None,
+        budget_enabled=current.budget_enabled if current else None,
+        budget_auto_cancel=current.budget_auto_cancel if current else None,
+    )
+
 
 class PlanModeCommand:
     """Command backend for toggling Claude Code permission mode."""
@@ -31,8 +81,6 @@ class PlanModeCommand:
     description = "Toggle Claude Code plan mode on/auto/off"
 
     async def handle(self, ctx: CommandContext) -> CommandResult | None:
-        from ..chat_prefs import ChatPrefsStore, resolve_prefs_path
-        from ..engine_overrides import EngineOverrides
         from ._resolve_engine import resolve_effective_engine
 
         config_path = ctx.config_path
@@ -56,13 +104,14 @@ class PlanModeCommand:
                 parse_mode="HTML",
             )
 
-        chat_prefs = ChatPrefsStore(resolve_prefs_path(config_path))
+        chat_prefs = _prefs_store(config_path)
         chat_id = ctx.message.channel_id
         engine = current_engine
         args = ctx.args_text.strip().lower()
+        # Every branch reads the same override; fetch it once up front.
+        current = await chat_prefs.get_engine_override(chat_id, engine)
 
         if args == "show":
-            current = await chat_prefs.get_engine_override(chat_id, engine)
             mode = current.permission_mode if current else None
             if mode == "plan":
                 label = "<b>on</b> (plan mode)"
@@ -78,27 +127,12 @@ class PlanModeCommand:
 
         if args == "":
             # Toggle: if currently plan/auto mode, turn off; otherwise turn on
-            current = await chat_prefs.get_engine_override(chat_id, engine)
             current_mode = current.permission_mode if current else None
             args = "off" if current_mode in ("plan", "auto") else "on"
 
         if args in PERMISSION_MODES:
             mode = PERMISSION_MODES[args]
-            current = await chat_prefs.get_engine_override(chat_id, engine)
-            updated = EngineOverrides(
-                model=current.model if current else None,
-                reasoning=current.reasoning if current else None,
-                permission_mode=mode,
-                ask_questions=current.ask_questions if current else None,
-                diff_preview=current.diff_preview if current else None,
-                show_api_cost=current.show_api_cost if current else None,
-                show_subscription_usage=current.show_subscription_usage
-                if current
-                else None,
-                show_resume_line=current.show_resume_line if current else None,
-                budget_enabled=current.budget_enabled if current else None,
-                budget_auto_cancel=current.budget_auto_cancel if current else None,
-            )
+            updated = _with_permission_mode(current, mode)
             await chat_prefs.set_engine_override(chat_id, engine, updated)
             cli_mode = "plan" if mode in ("plan", "auto") else mode
             logger.info(
@@ -118,21 +152,7 @@ class PlanModeCommand:
             )
 
         if args == "clear":
-            current = await chat_prefs.get_engine_override(chat_id, engine)
-            updated = EngineOverrides(
-                model=current.model if current else None,
-                reasoning=current.reasoning if current else None,
-                permission_mode=None,
-                ask_questions=current.ask_questions if current else None,
-                diff_preview=current.diff_preview if current else None,
-                show_api_cost=current.show_api_cost if current else None,
-                show_subscription_usage=current.show_subscription_usage
-                if current
-                else None,
-                show_resume_line=current.show_resume_line if current else None,
-                budget_enabled=current.budget_enabled if current else None,
-                budget_auto_cancel=current.budget_auto_cancel if current else None,
-            )
+            updated = _with_permission_mode(current, None)
             await chat_prefs.set_engine_override(chat_id, engine, updated)
             logger.info("planmode.cleared", chat_id=chat_id, command="planmode")
             return CommandResult(
@@ -141,7 +161,7 @@ class PlanModeCommand:
                 parse_mode="HTML",
             )
 
-        return CommandResult(text=PLANMODE_USAGE, notify=True)
+        return _PLANMODE_USAGE_RESULT
 
 
 BACKEND: CommandBackend = PlanModeCommand()
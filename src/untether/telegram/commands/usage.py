@@ -7,7 +7,7 @@ do not use Anthropic OAuth credentials.
 from __future__ import annotations
 
 import contextlib
-import json
+import functools
 import subprocess
 import sys
 import time
@@ -15,6 +15,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 import httpx
+import msgspec
 
 from ...commands import CommandBackend, CommandContext, CommandResult
 from ...logging import get_logger
@@ -34,19 +35,76 @@ _HTTP_STATUS_HINTS: dict[int, str] = {
     504: "Anthropic API gateway timed out. Try again shortly.",
 }
 
+# Fixed replies; CommandResult is frozen, so one instance can be returned
+# from every call.
+_NO_CREDENTIALS_RESULT = CommandResult(
+    text="No Claude Code credentials found (checked ~/.claude/.credentials.json"
+    " and macOS Keychain). Run 'claude login' to authenticate.",
+    notify=True,
+)
+_TOKEN_INVALID_RESULT = CommandResult(
+    text="Claude Code OAuth token expired or invalid. "
+    "Run a Claude Code session to refresh it.",
+    notify=True,
+)
+_TOKEN_SCOPE_RESULT = CommandResult(
+    text="Claude Code OAuth token lacks user:profile scope.",
+    notify=True,
+)
+_CONNECT_FAILED_RESULT = CommandResult(
+    text="Could not reach the Anthropic usage API"
+    " \N{EM DASH} check your network connection and try again.",
+    notify=True,
+)
+_TIMEOUT_RESULT = CommandResult(
+    text="Anthropic usage API timed out"
+    " \N{EM DASH} this is usually temporary. Try again shortly.",
+    notify=True,
+)
+
+# Shared across fetches: building an AsyncClient loads the CA bundle into a
+# fresh SSL context, and a live client can reuse a pooled connection.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=_TIMEOUT,
+            headers={
+                "Content-Type": "application/json",
+                "anthropic-beta": "oauth-2025-04-20",
+            },
+        )
+    return _client
+
+
+_BAR_WIDTH = 10
+# Every fill level of the default-width bar, indexed by filled cell count.
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
 
-def _progress_bar(pct: float, width: int = 10) -> str:
+def _progress_bar(pct: float, width: int = _BAR_WIDTH) -> str:
     """Render a text progress bar like ████░░░░░░."""
     filled = round(pct / 100 * width)
     filled = max(0, min(width, filled))
+    if width == _BAR_WIDTH:
+        return _BARS[filled]
     return "█" * filled + "░" * (width - filled)
 
 
-def _time_until(iso_ts: str) -> str:
-    """Format a reset timestamp as 'Xh Ym' from now."""
+# Reset timestamps stay fixed for a whole window, so the same few strings
+# are parsed on every footer render.
+_parse_reset = functools.lru_cache(maxsize=64)(datetime.fromisoformat)
+
+
+def _time_until(iso_ts: str, now: datetime | None = None) -> str:
+    """Format a reset timestamp as 'Xh Ym' from ``now`` (default: current time)."""
     try:
-        reset = datetime.fromisoformat(iso_ts)
-        now = datetime.now(UTC)
+        reset = _parse_reset(iso_ts)
+        if now is None:
+            now = datetime.now(UTC)
         delta = reset - now
         total_seconds = max(0, int(delta.total_seconds()))
         hours, remainder = divmod(total_seconds, 3600)
@@ -62,6 +120,16 @@ def _time_until(iso_ts: str) -> str:
         return "unknown"
 
 
+# Parsed file credentials per path as (st_mtime_ns, token, expires_at_ms).
+# Claude Code rewrites the file when it refreshes the token, which bumps the
+# mtime and forces a re-read.
+_CREDENTIALS_CACHE: dict[Path, tuple[int, str, int]] = {}
+
+
+def clear_credentials_cache() -> None:
+    _CREDENTIALS_CACHE.clear()
+
+
 def _read_token_expiry_ms(
     credentials_path: Path = _DEFAULT_CREDENTIALS_PATH,
 ) -> int | None:
@@ -84,15 +152,26 @@ def _read_access_token_with_expiry(
     credentials_path: Path = _DEFAULT_CREDENTIALS_PATH,
 ) -> tuple[str, bool, int]:
     """Like ``_read_access_token`` but also returns ``expires_at_ms`` (#410)."""
-    raw = _read_credentials_raw(credentials_path)
-    if raw is None:
-        raise FileNotFoundError(
-            f"No Claude Code credentials at {credentials_path} or macOS Keychain"
-        )
-    data = json.loads(raw)
-    oauth = data["claudeAiOauth"]
-    token = oauth["accessToken"]
-    expires_at_ms = oauth.get("expiresAt", 0)
+    try:
+        mtime_ns: int | None = credentials_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    cached = _CREDENTIALS_CACHE.get(credentials_path)
+    if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+        _, token, expires_at_ms = cached
+    else:
+        raw = _read_credentials_raw(credentials_path)
+        if raw is None:
+            raise FileNotFoundError(
+                f"No Claude Code credentials at {credentials_path} or macOS Keychain"
+            )
+        data = msgspec.json.decode(raw)
+        oauth = data["claudeAiOauth"]
+        token = oauth["accessToken"]
+        expires_at_ms = oauth.get("expiresAt", 0)
+        # Only the file is cached; Keychain reads have no mtime to check.
+        if mtime_ns is not None:
+            _CREDENTIALS_CACHE[credentials_path] = (mtime_ns, token, expires_at_ms)
     is_expired = (time.time() * 1000) >= (expires_at_ms - 300_000)
     return token, is_expired, expires_at_ms
 
@@ -153,18 +232,11 @@ async def fetch_claude_usage(
         # Claude Code refreshes its own token — if it's expired, it'll be
         # refreshed next time Claude Code runs. For now, try anyway.
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            _USAGE_URL,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-                "anthropic-beta": "oauth-2025-04-20",
-            },
-            timeout=_TIMEOUT,
-        )
-        resp.raise_for_status()
-        return resp.json()
+    resp = await _get_client().get(
+        _USAGE_URL, headers={"Authorization": f"Bearer {token}"}
+    )
+    resp.raise_for_status()
+    return msgspec.json.decode(resp.content)
 
 
 def format_usage_compact(data: dict) -> str | None:
@@ -174,11 +246,12 @@ def format_usage_compact(data: dict) -> str | None:
     or ``5h: 72% (1h 14m) | 7d: 30%`` (reset times shown when >50%).
     """
     parts: list[str] = []
+    now = datetime.now(UTC)
     five_hour = data.get("five_hour")
     if five_hour:
         pct = five_hour["utilization"]
         if pct >= 50:
-            reset = _time_until(five_hour["resets_at"])
+            reset = _time_until(five_hour["resets_at"], now)
             parts.append(f"5h: {pct:.0f}% ({reset})")
         else:
             parts.append(f"5h: {pct:.0f}%")
@@ -187,7 +260,7 @@ def format_usage_compact(data: dict) -> str | None:
     if seven_day:
         pct = seven_day["utilization"]
         if pct >= 50:
-            reset = _time_until(seven_day["resets_at"])
+            reset = _time_until(seven_day["resets_at"], now)
             parts.append(f"7d: {pct:.0f}% ({reset})")
         else:
             parts.append(f"7d: {pct:.0f}%")
@@ -200,19 +273,20 @@ def format_usage_compact(data: dict) -> str | None:
 def format_usage(data: dict) -> str:
     """Format usage data into a concise Telegram message."""
     lines: list[str] = ["📊 Claude Code Usage\n"]
+    now = datetime.now(UTC)
 
     five_hour = data.get("five_hour")
     if five_hour:
         pct = five_hour["utilization"]
         bar = _progress_bar(pct)
-        reset = _time_until(five_hour["resets_at"])
+        reset = _time_until(five_hour["resets_at"], now)
         lines.append(f"5h window: {bar} {pct:.0f}% (resets in {reset})")
 
     seven_day = data.get("seven_day")
     if seven_day:
         pct = seven_day["utilization"]
         bar = _progress_bar(pct)
-        reset = _time_until(seven_day["resets_at"])
+        reset = _time_until(seven_day["resets_at"], now)
         lines.append(f"Weekly:    {bar} {pct:.0f}% (resets in {reset})")
 
     sonnet = data.get("seven_day_sonnet")
@@ -325,24 +399,13 @@ class UsageCommand:
         try:
             data = await fetch_claude_usage()
         except FileNotFoundError:
-            return CommandResult(
-                text="No Claude Code credentials found (checked ~/.claude/.credentials.json"
-                " and macOS Keychain). Run 'claude login' to authenticate.",
-                notify=True,
-            )
+            return _NO_CREDENTIALS_RESULT
         except httpx.HTTPStatusError as exc:
             status = exc.response.status_code
             if status == 401:
-                return CommandResult(
-                    text="Claude Code OAuth token expired or invalid. "
-                    "Run a Claude Code session to refresh it.",
-                    notify=True,
-                )
+                return _TOKEN_INVALID_RESULT
             if status == 403:
-                return CommandResult(
-                    text="Claude Code OAuth token lacks user:profile scope.",
-                    notify=True,
-                )
+                return _TOKEN_SCOPE_RESULT
             hint = _HTTP_STATUS_HINTS.get(status, "Unexpected error.")
             if status == 429:
                 logger.warning("usage.rate_limited", status=status)
@@ -354,18 +417,10 @@ class UsageCommand:
             )
         except httpx.ConnectError:
             logger.exception("usage.connect_failed")
-            return CommandResult(
-                text="Could not reach the Anthropic usage API"
-                " \N{EM DASH} check your network connection and try again.",
-                notify=True,
-            )
+            return _CONNECT_FAILED_RESULT
         except httpx.TimeoutException:
             logger.exception("usage.timeout")
-            return CommandResult(
-                text="Anthropic usage API timed out"
-                " \N{EM DASH} this is usually temporary. Try again shortly.",
-                notify=True,
-            )
+            return _TIMEOUT_RESULT
         except Exception as exc:
             logger.exception("usage.fetch_failed", error=str(exc))
             return CommandResult(
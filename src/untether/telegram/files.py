@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import io
 import os
+import re
 import shlex
 import tempfile
 import zipfile
@@ -12,6 +13,10 @@ from ..logging import get_logger
 
 logger = get_logger(__name__)
 
+# Anything shlex treats differently from str.split(): quotes, escapes, and
+# whitespace outside shlex's " \t\r\n" set.
+_SHLEX_SPECIAL_RE = re.compile(r"[\"'\\]|[^\S \t\r\n]")
+
 __all__ = [
     "ZipTooLargeError",
     "deduplicate_target",
@@ -33,6 +38,8 @@ __all__ = [
 def split_command_args(text: str) -> tuple[str, ...]:
     if not text.strip():
         return ()
+    if _SHLEX_SPECIAL_RE.search(text) is None:
+        return tuple(text.split())
     try:
         return tuple(shlex.split(text))
     except ValueError:
@@ -227,10 +227,10 @@ def check_setup(
             else _CREATE_CONFIG_TITLE
         )
         issues.append(config_issue(config_path, title=title))
-        return SetupResult(issues=issues, config_path=config_path)
+        return SetupResult(issues=tuple(issues), config_path=config_path)
 
     issues.extend(backend_issues)
-    return SetupResult(issues=issues, config_path=config_path)
+    return SetupResult(issues=tuple(issues), config_path=config_path)
 
 
 def mask_token(token: str) -> str:
@@ -12,7 +12,7 @@ from .transport_runtime import TransportRuntime
 
 @dataclass(frozen=True, slots=True)
 class SetupResult:
-    issues: list[SetupIssue]
+    issues: tuple[SetupIssue, ...]
     config_path: Path
 
     @property
@@ -5,7 +5,6 @@ from typing import Any
 
 import anyio
 from anyio.abc import ByteReceiveStream
-from anyio.streams.buffered import BufferedByteReceiveStream
 
 from ..logging import log_pipeline
 
@@ -13,13 +12,34 @@ _MAX_LINE_BYTES = 10 * 1024 * 1024  # 10 MB — generous for any legitimate JSON
 
 
 async def iter_bytes_lines(stream: ByteReceiveStream) -> AsyncIterator[bytes]:
-    buffered = BufferedByteReceiveStream(stream)
+    """Yield newline-delimited lines (without the ``\n``) from *stream*.
+
+    Each receive is split in one pass, so a chunk holding many small JSONL
+    events costs a single await. Only a trailing partial line is carried
+    over to the next chunk. A partial line still pending at EOF is dropped,
+    and one exceeding ``_MAX_LINE_BYTES`` raises ``anyio.DelimiterNotFound``.
+    """
+    pending = bytearray()
     while True:
         try:
-            line = await buffered.receive_until(b"\n", _MAX_LINE_BYTES)
-        except (anyio.IncompleteRead, anyio.ClosedResourceError):
+            chunk = await stream.receive()
+        except (anyio.EndOfStream, anyio.ClosedResourceError):
             return
-        yield line
+        # One C-level split frames every complete line in the chunk; the
+        # last element is whatever follows the final newline.
+        lines = chunk.split(b"\n")
+        tail = lines.pop()
+        if lines:
+            if pending:
+                pending += lines[0]
+                lines[0] = bytes(pending)
+                pending.clear()
+            for line in lines:
+                yield line
+        if tail:
+            pending += tail
+            if len(pending) >= _MAX_LINE_BYTES:
+                raise anyio.DelimiterNotFound(_MAX_LINE_BYTES)
 
 
 _STDERR_CAPTURE_MAX = 20
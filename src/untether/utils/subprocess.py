@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import fcntl
 import os
 import shutil
 import signal
@@ -341,6 +342,49 @@ def live_engine_subprocess_count() -> int:
     return _LIVE_ENGINE_SUBPROCESSES
 
 
+# Engines stream tool output in bursts far larger than the 64 KiB default
+# pipe; a bigger buffer means fewer reader wakeups per burst. Clamped to
+# /proc/sys/fs/pipe-max-size, which is the most an unprivileged process
+# may request; read once, the sysctl does not change under a running bridge.
+_PIPE_SIZE_TARGET = 1 << 20
+_PIPE_MAX_SIZE_PATH = "/proc/sys/fs/pipe-max-size"
+_PIPE_SIZE: int | None = None
+
+
+def _pipe_size_limit() -> int:
+    global _PIPE_SIZE
+    if _PIPE_SIZE is None:
+        try:
+            with open(_PIPE_MAX_SIZE_PATH, encoding="ascii") as fh:
+                _PIPE_SIZE = min(_PIPE_SIZE_TARGET, int(fh.read().strip()))
+        except (OSError, ValueError):
+            _PIPE_SIZE = _PIPE_SIZE_TARGET
+    return _PIPE_SIZE
+
+
+def _enlarge_child_pipe(pid: int, fd: int) -> None:
+    """Best-effort ``F_SETPIPE_SZ`` on the pipe behind child fd *fd*.
+
+    anyio exposes no public handle on the parent's end of the pipe, so this
+    opens the child's end through ``/proc/<pid>/fd`` — the same pipe object
+    — and resizes it there. Linux-only; silently gives up elsewhere or when
+    the child has already gone.
+    """
+    set_pipe_sz = getattr(fcntl, "F_SETPIPE_SZ", None)
+    if set_pipe_sz is None:
+        return
+    try:
+        pipe_fd = os.open(f"/proc/{pid}/fd/{fd}", os.O_WRONLY | os.O_NONBLOCK)
+    except OSError:
+        return
+    try:
+        fcntl.fcntl(pipe_fd, set_pipe_sz, _pipe_size_limit())
+    except OSError:
+        logger.debug("subprocess.pipe_resize_failed", pid=pid, fd=fd, exc_info=True)
+    finally:
+        os.close(pipe_fd)
+
+
 @asynccontextmanager
 async def manage_subprocess(
     cmd: Sequence[str],
@@ -364,6 +408,10 @@ async def manage_subprocess(
         kwargs.setdefault("start_new_session", True)
     proc = await anyio.open_process(cmd, **kwargs)
     _incr_live_engine_subprocesses(1)
+    if getattr(proc, "stdout", None) is not None:
+        _enlarge_child_pipe(proc.pid, 1)
+    if getattr(proc, "stderr", None) is not None:
+        _enlarge_child_pipe(proc.pid, 2)
     try:
         yield proc
     finally:
@@ -72,3 +72,33 @@ def _clear_cancel_dedup() -> None:
     _RECENT_CANCELS.clear()
     yield
     _RECENT_CANCELS.clear()
+
+
+def _module_cache_clears() -> tuple[Callable[[], None], ...]:
+    from untether.plugins import reset_plugin_state
+    from untether.runners.claude import clear_claude_cmd_cache
+    from untether.settings import clear_settings_cache
+    from untether.telegram.commands.planmode import clear_prefs_stores
+    from untether.telegram.commands.usage import clear_credentials_cache
+
+    return (
+        clear_settings_cache,
+        clear_claude_cmd_cache,
+        clear_prefs_stores,
+        clear_credentials_cache,
+        reset_plugin_state,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_module_caches() -> None:
+    """Several modules memoise per-process lookups in module-level caches.
+    Clear them all around every test so state patched in by one test never
+    answers for the next; new caches register in ``_module_cache_clears``.
+    """
+    clears = _module_cache_clears()
+    for clear in clears:
+        clear()
+    yield
+    for clear in clears:
+        clear()
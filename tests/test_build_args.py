@@ -94,6 +94,14 @@ class TestClaudeBuildArgs:
         # Should be comma-separated list
         assert "Bash" in args[idx + 1]
 
+    def test_allowed_tools_mixed_values_fall_back_to_generic_join(self) -> None:
+        from untether.runners.claude import _coerce_comma_list
+
+        assert _coerce_comma_list(["Bash", "Read"]) == "Bash,Read"
+        assert _coerce_comma_list(["Bash", "", None, 3]) == "Bash,3"
+        assert _coerce_comma_list(("Read",)) == "Read"
+        assert _coerce_comma_list([]) is None
+
     def test_extra_args_default_empty(self) -> None:
         """`extra_args=[]` produces byte-identical argv to the pre-#407
         behaviour — no extra tokens introduced."""
@@ -9,11 +9,16 @@ import pytest
 
 from tests.telegram_fakes import FakeBot, FakeTransport, make_cfg
 from untether.commands import CommandContext, CommandResult
+from untether.config import ConfigError
 from untether.runner_bridge import _EPHEMERAL_MSGS
 from untether.telegram.bridge import TelegramBridgeConfig
 from untether.telegram.commands import dispatch as dispatch_mod
-from untether.telegram.commands.dispatch import _dispatch_callback, _parse_callback_data
-from untether.telegram.types import TelegramCallbackQuery
+from untether.telegram.commands.dispatch import (
+    _dispatch_callback,
+    _dispatch_command,
+    _parse_callback_data,
+)
+from untether.telegram.types import TelegramCallbackQuery, TelegramIncomingMessage
 
 
 class _StubScheduler:
@@ -213,6 +218,56 @@ async def test_dispatch_callback_registers_ephemeral_with_callback_query_id(
     _EPHEMERAL_MSGS.clear()
 
 
+@pytest.mark.anyio
+async def test_dispatch_callback_answers_while_reply_in_flight(monkeypatch) -> None:
+    """The spinner is cleared concurrently with the reply send, not after it."""
+    transport = FakeTransport()
+    cfg = make_cfg(transport)
+    bot: FakeBot = cfg.bot  # type: ignore[assignment]
+    backend = _StubBackend(CommandResult(text="Approved permission request"))
+    monkeypatch.setattr(dispatch_mod, "get_command", lambda *a, **kw: backend)
+
+    answered = anyio.Event()
+    orig_answer = bot.answer_callback_query
+    orig_send = transport.send
+
+    async def _answer(query_id, text=None):
+        result = await orig_answer(query_id, text=text)
+        answered.set()
+        return result
+
+    async def _send(**kwargs):
+        # Would deadlock if the callback were only answered after send.
+        await answered.wait()
+        return await orig_send(**kwargs)
+
+    bot.answer_callback_query = _answer  # type: ignore[assignment]
+    transport.send = _send  # type: ignore[assignment]
+
+    _EPHEMERAL_MSGS.clear()
+    try:
+        with anyio.fail_after(2):
+            await _dispatch_callback(
+                cfg,
+                _make_callback_query(),
+                "test_cmd",
+                "args",
+                None,
+                {},
+                AsyncMock(),
+                None,
+                False,
+                None,
+                "cb-concurrent",
+            )
+
+        assert len(bot.callback_calls) == 1
+        assert bot.callback_calls[0]["text"] is None
+        assert any("Approved" in s["message"].text for s in transport.send_calls)
+    finally:
+        _EPHEMERAL_MSGS.clear()
+
+
 @pytest.mark.anyio
 async def test_dispatch_callback_no_ephemeral_without_callback_query_id(
     monkeypatch,
@@ -638,3 +693,61 @@ async def test_callback_allowed_when_no_user_restriction() -> None:
         )
 
     assert backend._handle_called == 1
+
+
+def _make_command_message() -> TelegramIncomingMessage:
+    return TelegramIncomingMessage(
+        transport="telegram",
+        chat_id=123,
+        message_id=7,
+        text="/test_cmd args",
+        reply_to_message_id=None,
+        reply_to_text=None,
+        sender_id=456,
+    )
+
+
+async def _run_dispatch_command(cfg: TelegramBridgeConfig) -> None:
+    await _dispatch_command(
+        cfg,
+        _make_command_message(),
+        "/test_cmd args",
+        "test_cmd",
+        "args",
+        {},
+        AsyncMock(),
+        None,
+        False,
+        None,
+        None,
+    )
+
+
+@pytest.mark.anyio
+async def test_dispatch_command_reports_sanitised_lookup_error(monkeypatch) -> None:
+    transport = FakeTransport()
+    cfg = make_cfg(transport)
+
+    def _get_command(*args, **kwargs):
+        raise ConfigError("Failed to load /home/user/.secret plugin")
+
+    monkeypatch.setattr(dispatch_mod, "get_command", _get_command)
+
+    await _run_dispatch_command(cfg)
+
+    assert len(transport.send_calls) == 1
+    text = transport.send_calls[0]["message"].text
+    assert text.startswith("error: ")
+    assert "/home/user" not in text
+    assert transport.send_calls[0]["options"].reply_to.message_id == 7
+
+
+@pytest.mark.anyio
+async def test_dispatch_command_ignores_unknown_command(monkeypatch) -> None:
+    transport = FakeTransport()
+    cfg = make_cfg(transport)
+    monkeypatch.setattr(dispatch_mod, "get_command", lambda *a, **kw: None)
+
+    await _run_dispatch_command(cfg)
+
+    assert transport.send_calls == []
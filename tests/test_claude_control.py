@@ -4,6 +4,7 @@ registry lifecycle, auto-approve drain, and full tool-use lifecycle."""
 from __future__ import annotations
 
 import json
+import os
 from typing import Any
 from unittest.mock import AsyncMock
 
@@ -598,7 +599,7 @@ async def test_drain_auto_approve_uses_provided_stdin() -> None:
 
     provided.send.assert_awaited_once()
     runner._proc_stdin.send.assert_not_awaited()  # type: ignore[union-attr]
-    assert state.auto_approve_queue == []
+    assert not state.auto_approve_queue
 
 
 @pytest.mark.anyio
@@ -612,8 +613,55 @@ async def test_drain_auto_approve_falls_back_to_proc_stdin() -> None:
 
     await runner._drain_auto_approve(state)
 
-    assert runner._proc_stdin.send.await_count == 2  # type: ignore[union-attr]
-    assert state.auto_approve_queue == []
+    runner._proc_stdin.send.assert_awaited_once()  # type: ignore[union-attr]
+    assert not state.auto_approve_queue
+
+
+@pytest.mark.anyio
+async def test_drain_auto_approve_batches_queue_into_one_send() -> None:
+    """A burst of queued approvals is written as one JSONL batch."""
+    runner = ClaudeRunner(claude_cmd="claude")
+    stdin = AsyncMock(name="stdin")
+
+    state = ClaudeStreamState()
+    state.auto_approve_queue.extend(["req-batch-1", "req-batch-2", "req-batch-3"])
+
+    await runner._drain_auto_approve(state, stdin=stdin)
+
+    stdin.send.assert_awaited_once()
+    payload = stdin.send.await_args.args[0]
+    lines = payload.decode().splitlines()
+    assert [json.loads(line)["response"]["request_id"] for line in lines] == [
+        "req-batch-1",
+        "req-batch-2",
+        "req-batch-3",
+    ]
+    assert payload.endswith(b"\n")
+
+
+@pytest.mark.anyio
+async def test_drain_auto_approve_writes_batch_to_pty() -> None:
+    """Without a pipe, the batch is written to the PTY master in one writev."""
+    runner = ClaudeRunner(claude_cmd="claude")
+    runner._proc_stdin = None
+    read_fd, write_fd = os.pipe()
+    runner._pty_master_fd = write_fd
+
+    state = ClaudeStreamState()
+    state.auto_approve_queue.extend(["req-pty-1", "req-pty-2"])
+    try:
+        await runner._drain_auto_approve(state)
+        os.close(write_fd)
+        written = os.read(read_fd, 65536)
+    finally:
+        os.close(read_fd)
+
+    lines = written.decode().splitlines()
+    assert [json.loads(line)["response"]["request_id"] for line in lines] == [
+        "req-pty-1",
+        "req-pty-2",
+    ]
+    assert not state.auto_approve_queue
 
 
 # ===========================================================================
@@ -1241,7 +1289,7 @@ def test_expired_control_request_queues_auto_deny() -> None:
 
     # Backdate the request to be older than the 5-minute timeout
     evt_data, _ = state.pending_control_requests["req-old"]
-    state.pending_control_requests["req-old"] = (evt_data, _time.time() - 301.0)
+    state.pending_control_requests["req-old"] = (evt_data, _time.monotonic() - 301.0)
 
     # Trigger a NEW control request — the cleanup runs when processing new requests
     new_event = _decode_event(
@@ -1305,7 +1353,10 @@ def test_handled_request_not_auto_denied_on_expiry() -> None:
 
     # Backdate it past the 5-minute timeout
     evt_data, _ = state.pending_control_requests["req-handled"]
-    state.pending_control_requests["req-handled"] = (evt_data, _time.time() - 301.0)
+    state.pending_control_requests["req-handled"] = (
+        evt_data,
+        _time.monotonic() - 301.0,
+    )
 
     # Trigger a new control request — reconciliation should run
     new_event = _decode_event(
@@ -382,6 +382,31 @@ def _feed_tool_result(
     )
 
 
+def test_tool_result_preview_keeps_tail_of_long_output() -> None:
+    state = ClaudeStreamState()
+    translate_claude_event(
+        _decode_event(_make_tool_use_event("Bash", "toolu_long", {"command": "ls"})),
+        title="claude",
+        state=state,
+        factory=state.factory,
+    )
+    output = "x" * 10_000 + "\nlast line"
+    events = translate_claude_event(
+        _decode_event(_make_tool_result_event("toolu_long", output)),
+        title="claude",
+        state=state,
+        factory=state.factory,
+    )
+
+    event = events[-1]
+    assert isinstance(event, ActionEvent)
+    detail = event.action.detail
+    assert detail["result_len"] == len(output)
+    assert len(detail["result_preview"]) == claude_runner._RESULT_PREVIEW_MAX_CHARS
+    assert detail["result_preview"].startswith("…")
+    assert detail["result_preview"].endswith("\nlast line")
+
+
 def test_monitor_interim_tool_result_does_not_clear() -> None:
     """#374: while a Monitor's deadline is live, every interim stdout line keeps the
     handle so stall-suppression keeps firing. Crucially this holds even when the
@@ -1524,6 +1549,17 @@ def test_claude_resume_format_and_extract() -> None:
     assert runner.extract_resume("`codex resume sid`") is None
 
 
+def test_claude_resume_prefilter_is_case_insensitive() -> None:
+    runner = ClaudeRunner(claude_cmd="claude")
+
+    assert runner.is_resume_line("CLAUDE --resume sid")
+    assert runner.extract_resume("Claude -r sid") == ResumeToken(
+        engine=ENGINE, value="sid"
+    )
+    assert not runner.is_resume_line("codex resume sid")
+    assert runner.extract_resume("no resume command here") is None
+
+
 def test_build_runner_uses_shutil_which(monkeypatch) -> None:
     expected = r"C:\Tools\claude.cmd"
     called: dict[str, str] = {}
@@ -1539,6 +1575,36 @@ def test_build_runner_uses_shutil_which(monkeypatch) -> None:
     assert runner.claude_cmd == expected
 
 
+def test_build_runner_caches_resolved_claude_path(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_which(name: str) -> str | None:
+        calls.append(name)
+        return "/opt/bin/claude"
+
+    monkeypatch.setattr(claude_runner.shutil, "which", fake_which)
+    first = cast(ClaudeRunner, claude_runner.build_runner({}, Path("untether.toml")))
+    second = cast(ClaudeRunner, claude_runner.build_runner({}, Path("untether.toml")))
+
+    assert first.claude_cmd == second.claude_cmd == "/opt/bin/claude"
+    assert calls == ["claude"]
+
+
+def test_build_runner_retries_lookup_when_claude_missing(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_which(name: str) -> str | None:
+        calls.append(name)
+        return None
+
+    monkeypatch.setattr(claude_runner.shutil, "which", fake_which)
+    runner = cast(ClaudeRunner, claude_runner.build_runner({}, Path("untether.toml")))
+    claude_runner.build_runner({}, Path("untether.toml"))
+
+    assert runner.claude_cmd == "claude"
+    assert calls == ["claude", "claude"]
+
+
 def test_translate_success_fixture() -> None:
     state = ClaudeStreamState()
     events: list = []
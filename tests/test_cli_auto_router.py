@@ -81,7 +81,7 @@ def _settings() -> UntetherSettings:
 
 
 def test_run_auto_router_success_releases_lock(monkeypatch, tmp_path: Path) -> None:
-    setup = SetupResult(issues=[], config_path=tmp_path / "untether.toml")
+    setup = SetupResult(issues=(), config_path=tmp_path / "untether.toml")
     transport = _FakeTransport(setup)
     engine_backend = _engine_backend()
     config_path = tmp_path / "untether.toml"
@@ -126,7 +126,7 @@ def test_run_auto_router_success_releases_lock(monkeypatch, tmp_path: Path) -> N
 
 
 def test_run_auto_router_requires_tty_for_onboard(monkeypatch, tmp_path: Path) -> None:
-    setup = SetupResult(issues=[], config_path=tmp_path / "untether.toml")
+    setup = SetupResult(issues=(), config_path=tmp_path / "untether.toml")
     transport = _FakeTransport(setup)
 
     monkeypatch.setattr(
@@ -156,7 +156,7 @@ def test_run_auto_router_missing_config_noninteractive(
     monkeypatch, tmp_path: Path
 ) -> None:
     setup = SetupResult(
-        issues=[SetupIssue(title="create a config", lines=())],
+        issues=(SetupIssue(title="create a config", lines=()),),
         config_path=tmp_path / "missing.toml",
     )
     transport = _FakeTransport(setup)
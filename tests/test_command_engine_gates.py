@@ -218,6 +218,32 @@ class TestPlanModeEngineGate:
         assert "only available for claude" in result.text.lower()
 
 
+class TestPlanModePrefsStore:
+    def test_store_reused_per_prefs_file(self, tmp_path):
+        from untether.telegram.commands.planmode import _prefs_store
+
+        other = tmp_path / "other"
+        other.mkdir()
+        store = _prefs_store(tmp_path / "untether.toml")
+        assert _prefs_store(tmp_path / "untether.toml") is store
+        assert _prefs_store(other / "untether.toml") is not store
+
+    @pytest.mark.anyio
+    async def test_toggle_then_show_sees_new_mode(self, tmp_path):
+        cmd = PlanModeCommand()
+        config_path = tmp_path / "untether.toml"
+        for args_text, expected in (("", "plan mode <b>on</b>"), ("show", "on")):
+            ctx = FakeCommandContext(
+                args_text=args_text,
+                message=FakeMessage(),
+                config_path=config_path,
+                runtime=FakeTransportRuntime(default_engine="claude"),
+            )
+            result = await cmd.handle(ctx)  # type: ignore[arg-type]
+            assert result is not None
+            assert expected in result.text
+
+
 class TestUsageDebugMode:
     """#410: ``/usage debug`` appends a debug section with cache + token info."""
 
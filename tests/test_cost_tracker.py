@@ -16,7 +16,7 @@ def _reset_daily():
     """Reset the global daily cost tracker."""
     import untether.cost_tracker as mod
 
-    mod._daily_cost = ("", 0.0)
+    mod._daily_cost = mod._DailyCost()
 
 
 class TestRecordRunCost:
@@ -35,11 +35,34 @@ class TestRecordRunCost:
     def test_resets_on_new_day(self):
         import untether.cost_tracker as mod
 
-        mod._daily_cost = ("1999-01-01", 99.0)
+        mod._daily_cost = mod._DailyCost("1999-01-01", 99.0)
         record_run_cost(0.10)
         assert get_daily_cost() == 0.10
 
 
+class TestToday:
+    def test_matches_strftime_and_caches_until_midnight(self):
+        import time
+
+        import untether.cost_tracker as mod
+
+        mod._today_cache = (0.0, "")
+        assert mod._today() == time.strftime("%Y-%m-%d")
+        until, _ = mod._today_cache
+        assert time.time() < until <= time.time() + 25 * 3600
+        assert time.localtime(until)[3:6] == (0, 0, 0)
+
+    def test_recomputes_after_expiry(self):
+        import time
+
+        import untether.cost_tracker as mod
+
+        mod._today_cache = (time.time() + 60, "1999-01-01")
+        assert mod._today() == "1999-01-01"
+        mod._today_cache = (time.time() - 1, "1999-01-01")
+        assert mod._today() == time.strftime("%Y-%m-%d")
+
+
 class TestCheckRunBudget:
     def setup_method(self):
         _reset_daily()
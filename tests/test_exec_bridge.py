@@ -773,6 +773,38 @@ class TestFormatRunCost:
 # ---------------------------------------------------------------------------
 
 
+class TestProgressBar:
+    def test_default_width_clamps_and_rounds(self):
+        from untether.telegram.commands.usage import _progress_bar
+
+        assert _progress_bar(0) == "░" * 10
+        assert _progress_bar(72) == "███████░░░"
+        assert _progress_bar(150) == "█" * 10
+        assert _progress_bar(-5) == "░" * 10
+
+    def test_custom_width(self):
+        from untether.telegram.commands.usage import _progress_bar
+
+        assert _progress_bar(50, width=4) == "██░░"
+
+
+class TestTimeUntil:
+    def test_uses_supplied_now(self):
+        from datetime import UTC, datetime
+
+        from untether.telegram.commands.usage import _time_until
+
+        now = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+        assert _time_until("2026-01-01T13:14:00+00:00", now) == "1h 14m"
+        assert _time_until("2026-01-03T14:00:00+00:00", now) == "2d 2h"
+        assert _time_until("2026-01-01T11:00:00+00:00", now) == "0m"
+
+    def test_invalid_timestamp(self):
+        from untether.telegram.commands.usage import _time_until
+
+        assert _time_until("not-a-date") == "unknown"
+
+
 class TestFormatUsageCompact:
     def test_both_windows(self):
         from untether.telegram.commands.usage import format_usage_compact
@@ -1140,6 +1172,50 @@ class TestReadAccessToken:
         token, _ = _read_access_token(creds_file)
         assert token == "sk-file-token"
 
+    def test_file_reparsed_only_when_mtime_changes(self, tmp_path):
+        import json
+        import os
+
+        from untether.telegram.commands.usage import _read_access_token
+
+        creds_file = tmp_path / ".credentials.json"
+
+        def _write(token: str, mtime_ns: int) -> None:
+            creds = {"claudeAiOauth": {"accessToken": token, "expiresAt": 0}}
+            creds_file.write_text(json.dumps(creds))
+            os.utime(creds_file, ns=(mtime_ns, mtime_ns))
+
+        _write("sk-first", 1_000_000_000)
+        assert _read_access_token(creds_file)[0] == "sk-first"
+
+        # Same mtime: the cached parse is reused.
+        _write("sk-second", 1_000_000_000)
+        token, is_expired = _read_access_token(creds_file)
+        assert token == "sk-first"
+        assert is_expired
+
+        _write("sk-second", 2_000_000_000)
+        assert _read_access_token(creds_file)[0] == "sk-second"
+
+
+class TestUsageClient:
+    def test_client_is_shared_between_fetches(self, monkeypatch):
+        from untether.telegram.commands import usage
+
+        monkeypatch.setattr(usage, "_client", None)
+        client = usage._get_client()
+        assert usage._get_client() is client
+        assert client.headers["anthropic-beta"] == "oauth-2025-04-20"
+
+    @pytest.mark.anyio
+    async def test_closed_client_is_replaced(self, monkeypatch):
+        from untether.telegram.commands import usage
+
+        monkeypatch.setattr(usage, "_client", None)
+        client = usage._get_client()
+        await client.aclose()
+        assert usage._get_client() is not client
+
 
 # ---------------------------------------------------------------------------
 # ExceptionGroup unwrapping in run_runner_with_cancel (issue #17)
@@ -1,3 +1,4 @@
+import itertools
 from pathlib import Path
 from types import SimpleNamespace
 from typing import cast
@@ -11,6 +12,7 @@ from untether.markdown import (
     HARD_BREAK,
     STATUS,
     MarkdownFormatter,
+    MarkdownParts,
     action_status,
     assemble_markdown_parts,
     format_elapsed,
@@ -307,6 +309,29 @@ def test_progress_renderer_collapses_action_updates() -> None:
     assert "echo two" in lines[0]
 
 
+def test_progress_renderer_caches_completed_action_lines_only() -> None:
+    tracker = ProgressTracker(engine="codex")
+    events = [
+        action_started("a-1", "command", "echo one"),
+        action_completed("a-1", "command", "echo one", ok=True),
+        action_started("a-2", "command", "sleep 5"),
+    ]
+    for evt in events:
+        tracker.note_event(evt)
+    state = tracker.snapshot()
+    formatter = MarkdownFormatter(max_actions=5, verbosity="verbose")
+
+    first = formatter.render_progress_parts(state, elapsed_s=0.0)
+    completed_action = state.actions[0].action
+    assert set(formatter._line_cache) == {id(completed_action)}
+    assert set(formatter._detail_cache) == {id(completed_action)}
+
+    second = formatter.render_progress_parts(state, elapsed_s=0.0)
+    assert second.body == first.body
+    assert first.body is not None
+    assert first.body.split(HARD_BREAK)[0].startswith("✓ ")
+
+
 def test_progress_renderer_deterministic_output() -> None:
     events = [
         action_started("a-1", "command", "echo ok"),
@@ -332,6 +357,15 @@ def test_progress_renderer_deterministic_output() -> None:
     ) == assemble_markdown_parts(f2.render_progress_parts(t2.snapshot(), elapsed_s=1.0))
 
 
+def test_assemble_markdown_parts_skips_empty_chunks() -> None:
+    for header, body, footer in itertools.product(
+        ("", "head"), (None, "", "body"), (None, "", "foot")
+    ):
+        parts = MarkdownParts(header=header, body=body, footer=footer)
+        expected = "\n\n".join(c for c in (header, body, footer) if c)
+        assert assemble_markdown_parts(parts) == expected
+
+
 def test_format_elapsed_branches() -> None:
     assert format_elapsed(3661) == "1h 01m"
     assert format_elapsed(61) == "1m 01s"
@@ -344,6 +378,10 @@ def test_shorten_and_action_status_branches() -> None:
     shortened = shorten("hello world", 6)
     assert shortened.endswith("…")
     assert len(shortened) <= 6
+    assert shortened == "hello…"
+    assert shorten("ls   -la\n foo bar baz", 9) == "ls -la…"
+    assert shorten("a  b", 3) == "a b"
+    assert shorten("/very/long/path/to/file.py", 10) == "/very/lon…"
 
     action_ok = Action(id="ok", kind="command", title="x", detail={"exit_code": 0})
     action_fail = Action(id="fail", kind="command", title="x", detail={"exit_code": 2})
@@ -9,7 +9,14 @@ The structlog `_redact_event_dict` processor must strip:
 
 from __future__ import annotations
 
-from untether.logging import _redact_event_dict, _redact_text
+from typing import Any
+
+import pytest
+
+import untether.logging as logging_mod
+from untether.logging import _redact_event_dict, _redact_text, log_pipeline
+from untether.model import CompletedEvent
+from untether.runner import JsonlSubprocessRunner
 
 
 class TestRedactText:
@@ -81,3 +88,59 @@ class TestRedactEventDict:
             else True
         )
         assert "[REDACTED_TOKEN]" in out["blob"]
+
+
+class _RecordingLogger:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    def debug(self, event: str, **fields: Any) -> None:
+        self.calls.append(("debug", event, fields))
+
+    def info(self, event: str, **fields: Any) -> None:
+        self.calls.append(("info", event, fields))
+
+
+class _PipelineRunner(JsonlSubprocessRunner):
+    engine = "pipeline"
+
+
+def _emit_pipeline_events(logger: _RecordingLogger) -> None:
+    log_pipeline(logger, "runner.jsonl.line", seq=1)
+    _PipelineRunner()._log_completed_event(
+        logger=logger,
+        pid=42,
+        event=CompletedEvent(engine="pipeline", ok=True, answer="done"),
+        jsonl_seq=2,
+    )
+
+
+class TestPipelineLogGate:
+    def test_filtered_pipeline_level_emits_nothing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(logging_mod, "_PIPELINE_LEVEL_NAME", "debug")
+        monkeypatch.setattr(logging_mod, "_MIN_LEVEL", logging_mod._LEVELS["info"])
+        logger = _RecordingLogger()
+
+        assert logging_mod.pipeline_log_enabled() is False
+        _emit_pipeline_events(logger)
+
+        assert logger.calls == []
+
+    def test_info_pipeline_level_still_emits(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(logging_mod, "_PIPELINE_LEVEL_NAME", "info")
+        monkeypatch.setattr(logging_mod, "_MIN_LEVEL", logging_mod._LEVELS["info"])
+        logger = _RecordingLogger()
+
+        assert logging_mod.pipeline_log_enabled() is True
+        _emit_pipeline_events(logger)
+
+        assert [(level, event) for level, event, _ in logger.calls] == [
+            ("info", "runner.jsonl.line"),
+            ("info", "runner.completed.seen"),
+        ]
+        assert logger.calls[1][2]["pid"] == 42
+        assert logger.calls[1][2]["jsonl_seq"] == 2
@@ -35,6 +35,17 @@ class TestShortModelName:
     def test_case_insensitive(self) -> None:
         assert _short_model_name("Claude-Sonnet-4-5") == "sonnet 4.5"
 
+    def test_bare_family_case_insensitive(self) -> None:
+        assert _short_model_name("Claude-HAIKU") == "haiku"
+
+    def test_repeat_lookup_is_cached(self) -> None:
+        import untether.markdown as md
+
+        md._SHORT_MODEL_NAMES.clear()
+        assert _short_model_name("claude-opus-4-6") == "opus 4.6"
+        assert md._SHORT_MODEL_NAMES == {"claude-opus-4-6": "opus 4.6"}
+        assert _short_model_name("claude-opus-4-6") == "opus 4.6"
+
     def test_gemini_unchanged(self) -> None:
         assert _short_model_name("gemini-2.5-pro") == "gemini-2.5-pro"
 
@@ -2,7 +2,7 @@ from collections.abc import Iterator
 
 import pytest
 
-from tests.plugin_fixtures import FakeEntryPoint, install_entrypoints
+from tests.plugin_fixtures import FakeEntryPoint, FakeEntryPoints, install_entrypoints
 from untether import plugins
 
 
@@ -169,6 +169,49 @@ def test_reset_plugin_state_clears_cache(monkeypatch) -> None:
     assert calls["count"] == 2
 
 
+def test_load_entrypoint_memoises_hits_per_allowlist(monkeypatch) -> None:
+    discoveries = {"count": 0}
+
+    def _entry_points():
+        discoveries["count"] += 1
+        return FakeEntryPoints(
+            [
+                FakeEntryPoint(
+                    "hello",
+                    "untether_hello:BACKEND",
+                    plugins.COMMAND_GROUP,
+                    loader=object,
+                    dist_name="untether-hello",
+                )
+            ]
+        )
+
+    monkeypatch.setattr(plugins, "entry_points", _entry_points)
+
+    first = plugins.load_entrypoint(
+        plugins.COMMAND_GROUP, "hello", allowlist=["untether-hello"]
+    )
+    again = plugins.load_entrypoint(
+        plugins.COMMAND_GROUP, "hello", allowlist=["Untether_Hello"]
+    )
+    assert again is first
+    assert discoveries["count"] == 1
+
+    # A different allowlist (e.g. after a config reload) is discovered again.
+    plugins.load_entrypoint(plugins.COMMAND_GROUP, "hello")
+    assert discoveries["count"] == 2
+
+    # Misses are never memoised.
+    for _ in range(2):
+        with pytest.raises(plugins.PluginNotFound):
+            plugins.load_entrypoint(plugins.COMMAND_GROUP, "missing")
+    assert discoveries["count"] == 4
+
+    plugins.reset_plugin_state()
+    plugins.load_entrypoint(plugins.COMMAND_GROUP, "hello")
+    assert discoveries["count"] == 5
+
+
 def test_clear_load_errors_filters(monkeypatch) -> None:
     def loader():
         raise RuntimeError("boom")
@@ -632,6 +632,23 @@ async def test_drain_stderr_no_capture() -> None:
         await drain_stderr(receive, __import__("structlog").get_logger(), "test")  # type: ignore[arg-type]
 
 
+@pytest.mark.anyio
+async def test_iter_bytes_lines_splits_chunks_and_joins_partials() -> None:
+    """Lines spanning receives are reassembled; a trailing partial is dropped."""
+    import anyio
+
+    from untether.utils.streams import iter_bytes_lines
+
+    send, receive = anyio.create_memory_object_stream[bytes](8)
+    async with send:
+        for chunk in (b"a\nb", b"c\n\nd\ne", b"f", b"g\nh"):
+            await send.send(chunk)
+
+    lines = [line async for line in iter_bytes_lines(receive)]  # type: ignore[arg-type]
+
+    assert lines == [b"a", b"bc", b"", b"d", b"efg"]
+
+
 # ===========================================================================
 # Signal error hints
 # ===========================================================================
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -594,6 +595,69 @@ def test_load_settings_if_exists_loads(tmp_path: Path) -> None:
     assert loaded_path == config_path
 
 
+def test_load_settings_reuses_parsed_settings_until_file_changes(
+    tmp_path: Path,
+) -> None:
+    config_path = tmp_path / "untether.toml"
+    config_path.write_text(
+        'transport = "telegram"\n\n[transports.telegram]\n'
+        'bot_token = "token"\nchat_id = 123\nallow_any_user = true\n',
+        encoding="utf-8",
+    )
+
+    first, _ = load_settings(config_path)
+    second, _ = load_settings(config_path)
+    assert second is first
+
+    config_path.write_text(
+        'transport = "telegram"\n\n[transports.telegram]\n'
+        'bot_token = "token"\nchat_id = 4567\nallow_any_user = true\n',
+        encoding="utf-8",
+    )
+    reloaded, _ = load_settings(config_path)
+    assert reloaded is not first
+    assert reloaded.transports.telegram.chat_id == 4567
+
+
+def test_load_settings_cache_detects_same_size_rewrite(tmp_path: Path) -> None:
+    config_path = tmp_path / "untether.toml"
+    config_path.write_text(
+        'transport = "telegram"\n\n[transports.telegram]\n'
+        'bot_token = "token"\nchat_id = 123\nallow_any_user = true\n',
+        encoding="utf-8",
+    )
+    before = config_path.stat()
+
+    first, _ = load_settings(config_path)
+    config_path.write_text(
+        'transport = "telegram"\n\n[transports.telegram]\n'
+        'bot_token = "token"\nchat_id = 456\nallow_any_user = true\n',
+        encoding="utf-8",
+    )
+    os.utime(config_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    reloaded, _ = load_settings(config_path)
+    assert reloaded is not first
+    assert reloaded.transports.telegram.chat_id == 456
+
+
+def test_load_settings_cache_respects_env_overrides(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "untether.toml"
+    config_path.write_text(
+        'transport = "telegram"\n\n[transports.telegram]\n'
+        'bot_token = "token"\nchat_id = 123\nallow_any_user = true\n',
+        encoding="utf-8",
+    )
+
+    first, _ = load_settings(config_path)
+    monkeypatch.setenv("UNTETHER__DEFAULT_ENGINE", "claude")
+    second, _ = load_settings(config_path)
+    assert second is not first
+    assert second.default_engine == "claude"
+
+
 def test_load_settings_if_exists_rejects_non_file(tmp_path: Path) -> None:
     config_path = tmp_path / "config_dir"
     config_path.mkdir()
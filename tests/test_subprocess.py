@@ -1,3 +1,4 @@
+import fcntl
 import signal
 import sys
 from dataclasses import dataclass
@@ -532,3 +533,45 @@ async def test_reap_orphaned_group_signals_matching_identity(monkeypatch) -> Non
 
     assert reaped == [43001]
     assert (43001, signal.SIGTERM) in kill_calls
+
+
+_REPORT_PIPE_SIZES = (
+    "import fcntl, sys\n"
+    "sys.stdin.readline()\n"
+    "print(fcntl.fcntl(1, fcntl.F_GETPIPE_SZ), fcntl.fcntl(2, fcntl.F_GETPIPE_SZ))\n"
+)
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(
+    not hasattr(fcntl, "F_GETPIPE_SZ"), reason="F_SETPIPE_SZ is Linux-only"
+)
+async def test_manage_subprocess_enlarges_stdout_and_stderr_pipes() -> None:
+    async with subprocess_utils.manage_subprocess(
+        [sys.executable, "-c", _REPORT_PIPE_SIZES]
+    ) as proc:
+        assert proc.stdin is not None
+        assert proc.stdout is not None
+        await proc.stdin.send(b"go\n")
+        output = b"".join([chunk async for chunk in proc.stdout])
+        await proc.wait()
+
+    expected = subprocess_utils._pipe_size_limit()
+    assert output.split() == [str(expected).encode(), str(expected).encode()]
+
+
+def test_enlarge_child_pipe_ignores_missing_process() -> None:
+    subprocess_utils._enlarge_child_pipe(2**22 + 1, 1)
+
+
+def test_pipe_size_limit_reads_sysctl_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    sysctl = tmp_path / "pipe-max-size"
+    sysctl.write_text("262144\n", encoding="ascii")
+    monkeypatch.setattr(subprocess_utils, "_PIPE_MAX_SIZE_PATH", str(sysctl))
+    monkeypatch.setattr(subprocess_utils, "_PIPE_SIZE", None)
+
+    assert subprocess_utils._pipe_size_limit() == 262144
+    sysctl.write_text("4096\n", encoding="ascii")
+    assert subprocess_utils._pipe_size_limit() == 262144
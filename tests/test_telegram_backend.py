@@ -320,6 +320,19 @@ def test_telegram_backend_build_and_run_wires_config(
     assert kwargs["transport_id"] == "telegram"
 
 
+def test_event_loop_options_opt_into_uvloop_when_installed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    specs: dict[str, object | None] = {"uvloop": None}
+    monkeypatch.setattr(
+        telegram_backend.importlib.util, "find_spec", lambda name: specs[name]
+    )
+    assert telegram_backend._event_loop_options() == {}
+
+    specs["uvloop"] = object()
+    assert telegram_backend._event_loop_options() == {"use_uvloop": True}
+
+
 def test_detect_cli_version_returns_version(monkeypatch: pytest.MonkeyPatch) -> None:
     """Version detection extracts version from CLI output."""
     import subprocess as sp
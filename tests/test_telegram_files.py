@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import io
+import shlex
 import zipfile
 from pathlib import Path
 
@@ -48,6 +49,22 @@ def test_split_command_args_falls_back_on_bad_quotes() -> None:
     assert tg_files.split_command_args('bad "quote') == ("bad", '"quote')
 
 
+@pytest.mark.parametrize(
+    "text",
+    [
+        "put  src/a.py\tb",
+        "a #b c;d",
+        'say "hello world"',
+        "it is 'quoted'",
+        "esc\\ aped",
+        "nb\xa0space here",
+        "vt\x0btab",
+    ],
+)
+def test_split_command_args_matches_shlex(text: str) -> None:
+    assert tg_files.split_command_args(text) == tuple(shlex.split(text))
+
+
 def test_parse_file_command_unknown_command() -> None:
     command, rest, error = tg_files.parse_file_command("nope arg")
     assert command is None